@@ -6,11 +6,30 @@ Handles environment-specific configuration loading and validation.
 """
 
 import os
+import copy
 import yaml
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 
+# Prefer libyaml's C loader when available (~3-10x faster parse, same output)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML cache keyed by (path, mtime_ns) - avoids re-reading unchanged files
+_yaml_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """Load and parse a YAML file, reusing the cached parse if unchanged."""
+    cache_key = (str(path), path.stat().st_mtime_ns)
+    cached = _yaml_cache.get(cache_key)
+    if cached is None:
+        with open(path, "r") as f:
+            cached = yaml.load(f, Loader=_YamlLoader) or {}
+        _yaml_cache[cache_key] = cached
+    # Deep copy so callers can't mutate the cached parse
+    return copy.deepcopy(cached)
+
 
 @dataclass
 class DatabaseConfig:
@@ -65,15 +84,13 @@ class Config:
         # Load base config
         config_data = {}
         if base_path.exists():
-            with open(base_path, "r") as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = _load_yaml_cached(base_path)
 
         # Load environment-specific override
         env_path = base_path.parent / f"config.{env}.yaml"
         if env_path.exists():
-            with open(env_path, "r") as f:
-                env_data = yaml.safe_load(f) or {}
-                config_data = deep_merge(config_data, env_data)
+            env_data = _load_yaml_cached(env_path)
+            config_data = deep_merge(config_data, env_data)
 
         # Build config objects
         db_data = config_data.get("database", {})
@@ -118,18 +135,39 @@ class Config:
 
 def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """Deep merge two dictionaries, with override taking precedence."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # Iterative merge: one deep copy of the root, then in-place assignment,
+    # avoiding per-level dict.copy() and recursion frames
+    result = copy.deepcopy(base)
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
     return result
 
 
 # Default config instance
 _config: Optional[Config] = None
 
+# Built Config cache keyed by (path, env, base_mtime_ns, env_mtime_ns)
+_config_cache: Dict[Tuple[str, str, int, int], Config] = {}
+
+# (path, env) the current singleton was resolved from - repeat requests
+# for the same pair return it without re-statting the files
+_last_request: Optional[Tuple[str, Optional[str]]] = None
+
+
+def _file_mtime_ns(path: Path) -> int:
+    """Get file mtime in nanoseconds, or -1 if the file doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
 
 def get_config(config_path: str = None, env: str = None) -> Config:
     """
@@ -142,9 +180,13 @@ def get_config(config_path: str = None, env: str = None) -> Config:
     Returns:
         Config instance
     """
-    global _config
+    global _config, _last_request
 
     if _config is None or config_path is not None:
+        if _config is not None and (config_path, env) == _last_request:
+            return _config
+        requested = (config_path, env)
+
         if config_path is None:
             # Find config relative to this file
             base_dir = Path(__file__).parent.parent.parent
@@ -153,7 +195,17 @@ def get_config(config_path: str = None, env: str = None) -> Config:
         if env is None:
             env = os.environ.get("ETL_ENV", "dev")
 
-        _config = Config.from_yaml(config_path, env)
+        base_path = Path(config_path)
+        env_path = base_path.parent / f"config.{env}.yaml"
+        cache_key = (config_path, env, _file_mtime_ns(base_path), _file_mtime_ns(env_path))
+
+        config = _config_cache.get(cache_key)
+        if config is None:
+            config = Config.from_yaml(config_path, env)
+            _config_cache[cache_key] = config
+
+        _config = config
+        _last_request = requested
 
     return _config
 
@@ -6,13 +6,71 @@ Defines validation rules and quality checks for EMS data.
 """
 
 import re
-from datetime import datetime
-from typing import List, Tuple, Optional, Callable, Dict, Any
+import sys
+import functools
+from datetime import date, datetime
+from typing import List, Tuple, Optional, Callable, Dict, Any, NamedTuple
 from dataclasses import dataclass
 
+import pandas as pd
 
-@dataclass
-class ValidationResult:
+# Precompiled patterns and format tables - validators run per field per row,
+# so avoid re-lookup/rebuild costs inside the hot path
+_WS_RE = re.compile(r'\s+')
+_DATE_FMTS = ("%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d")
+_DATETIME_FMTS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%m/%d/%Y %H:%M")
+
+# Flag lookup tables - one hash probe replaces chained string comparisons
+_YESNO_MAP = {
+    "YES": 1, "Y": 1, "TRUE": 1, "1": 1,
+    "NO": 0, "N": 0, "FALSE": 0, "0": 0, "": 0
+}
+_BINARY_MAP = {"0": 0, "1": 1, "0.0": 0, "1.0": 1, "": 0}
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_date_cached(s: str) -> Optional[str]:
+    """
+    Parse a date string to ISO form, memoized on the raw value.
+
+    EMS date columns repeat heavily across rows, so each distinct
+    value pays the strptime cost only once.
+    """
+    # Fast path: already ISO (the overwhelmingly common case)
+    if len(s) == 10 and s[4] == '-' and s[7] == '-':
+        try:
+            date.fromisoformat(s)
+            return s
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FMTS:
+        try:
+            return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_datetime_cached(s: str) -> Optional[str]:
+    """Parse a datetime string to ISO form, memoized on the raw value."""
+    # Fast path: ISO datetime parses without the strptime loop
+    if len(s) == 19 and s[4] == '-' and s[7] == '-':
+        try:
+            return datetime.fromisoformat(s).isoformat()
+        except ValueError:
+            pass
+
+    for fmt in _DATETIME_FMTS:
+        try:
+            return datetime.strptime(s, fmt).isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+class ValidationResult(NamedTuple):
     """Result of a validation check."""
     is_valid: bool
     error_type: Optional[str] = None
@@ -20,6 +78,13 @@ class ValidationResult:
     cleaned_value: Any = None
 
 
+# Shared success results for the overwhelmingly common outcomes -
+# avoids a fresh allocation per validated field
+_OK_NONE = ValidationResult(is_valid=True, cleaned_value=None)
+_OK_ZERO = ValidationResult(is_valid=True, cleaned_value=0)
+_OK_ONE = ValidationResult(is_valid=True, cleaned_value=1)
+
+
 @dataclass
 class ValidationRule:
     """Single validation rule definition."""
@@ -38,12 +103,15 @@ class DataQualityValidator:
     defined rules, returning cleaned values or error details.
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize validator with EMS-specific rules."""
         self.rules: Dict[str, List[ValidationRule]] = {}
+        # Flattened (column, validator, is_required, default) dispatch plan,
+        # rebuilt on add_rule so validate_record avoids per-row dict probes
+        self._plan: List[Tuple[str, Callable, bool, Any]] = []
         self._register_default_rules()
 
-    def _register_default_rules(self):
+    def _register_default_rules(self) -> None:
         """Register default EMS validation rules."""
 
         # INCIDENT_DT - Required, must be valid date
@@ -122,11 +190,16 @@ class DataQualityValidator:
                 is_required=False
             ))
 
-    def add_rule(self, rule: ValidationRule):
+    def add_rule(self, rule: ValidationRule) -> None:
         """Add a validation rule for a column."""
+        # Interned column names match the interned CSV headers by identity
+        rule.column = sys.intern(rule.column)
         if rule.column not in self.rules:
             self.rules[rule.column] = []
         self.rules[rule.column].append(rule)
+        self._plan.append(
+            (rule.column, rule.validator, rule.is_required, rule.default_value)
+        )
 
     def validate_record(
         self,
@@ -146,24 +219,178 @@ class DataQualityValidator:
         cleaned = {}
         errors = []
 
-        for column, value in record.items():
-            if column in self.rules:
-                for rule in self.rules[column]:
-                    result = rule.validator(value)
-
-                    if not result.is_valid:
-                        if rule.is_required:
-                            errors.append((column, result.error_type, result.error_message))
-                        # Use default value if available
-                        cleaned[column] = rule.default_value
-                    else:
-                        cleaned[column] = result.cleaned_value
+        # Ruled columns: iterate the prebuilt plan (no per-field dict probe)
+        for column, validator, is_required, default in self._plan:
+            if column not in record:
+                continue
+
+            result = validator(record[column])
+
+            if not result.is_valid:
+                if is_required:
+                    errors.append((column, result.error_type, result.error_message))
+                # Use default value if available
+                cleaned[column] = default
             else:
+                cleaned[column] = result.cleaned_value
+
+        # Remaining columns - pass through with basic cleaning
+        rules = self.rules
+        clean_value = self._clean_value
+        for column, value in record.items():
+            if column not in rules:
+                cleaned[column] = clean_value(value)
+
+        return cleaned, errors
+
+    def validate_chunk(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Validate an entire chunk with vectorized pandas operations.
+
+        Applies the same rules as validate_record, but column-at-a-time
+        in pandas/NumPy C code instead of per-row Python dispatch.
+
+        Args:
+            df: DataFrame of raw string values (index = source row numbers)
+
+        Returns:
+            Tuple of (cleaned DataFrame, long-format errors DataFrame with
+            columns row_num, column, error_type, error_message)
+        """
+        cleaned = df.copy()
+        error_frames: List[pd.DataFrame] = []
+
+        for column in df.columns:
+            rules = self.rules.get(column)
+            if not rules:
                 # No rules - pass through with basic cleaning
-                cleaned[column] = self._clean_value(value)
+                if pd.api.types.is_string_dtype(cleaned[column]) or cleaned[column].dtype == object:
+                    stripped = cleaned[column].fillna("").str.strip()
+                    cleaned[column] = stripped.where(stripped != "", None)
+                continue
+
+            for rule in rules:
+                handler = getattr(self, f"_vector_{rule.rule_name}", None)
+                if handler is not None:
+                    cleaned[column], errors = handler(df[column], rule)
+                else:
+                    # Custom rule without a vectorized handler - fall back
+                    # to the per-value validator
+                    results = [rule.validator(v) for v in df[column]]
+                    cleaned[column] = [
+                        r.cleaned_value if r.is_valid else rule.default_value
+                        for r in results
+                    ]
+                    errors = None
+                    if rule.is_required:
+                        bad = [
+                            (idx, column, r.error_type, r.error_message)
+                            for idx, r in zip(df.index, results)
+                            if not r.is_valid
+                        ]
+                        if bad:
+                            errors = pd.DataFrame(
+                                bad,
+                                columns=["row_num", "column", "error_type", "error_message"]
+                            )
+
+                if errors is not None and not errors.empty:
+                    error_frames.append(errors)
+
+        if error_frames:
+            errors_df = pd.concat(error_frames, ignore_index=True)
+        else:
+            errors_df = pd.DataFrame(
+                columns=["row_num", "column", "error_type", "error_message"]
+            )
+
+        return cleaned, errors_df
+
+    # === Vectorized Validators (one per rule_name) ===
+
+    def _vector_valid_date(self, s: pd.Series, rule: ValidationRule):
+        """Vectorized date validation (mirrors _validate_date)."""
+        stripped = s.fillna("").astype(str).str.strip()
+        parsed = pd.to_datetime(stripped, format=_DATE_FMTS[0], errors="coerce")
+        for fmt in _DATE_FMTS[1:]:
+            mask = parsed.isna() & (stripped != "")
+            if not mask.any():
+                break
+            parsed[mask] = pd.to_datetime(stripped[mask], format=fmt, errors="coerce")
+
+        cleaned = parsed.dt.strftime("%Y-%m-%d").where(parsed.notna(), rule.default_value)
+
+        errors = None
+        if rule.is_required:
+            null_mask = stripped == ""
+            invalid_mask = parsed.isna() & ~null_mask
+            frames = []
+            if null_mask.any():
+                frames.append(pd.DataFrame({
+                    "row_num": s.index[null_mask],
+                    "column": rule.column,
+                    "error_type": "NULL_VALUE",
+                    "error_message": "Required date field is null or empty"
+                }))
+            if invalid_mask.any():
+                frames.append(pd.DataFrame({
+                    "row_num": s.index[invalid_mask],
+                    "column": rule.column,
+                    "error_type": "INVALID_DATE",
+                    "error_message": "Cannot parse date: " + stripped[invalid_mask].values
+                }))
+            if frames:
+                errors = pd.concat(frames, ignore_index=True)
 
         return cleaned, errors
 
+    def _vector_valid_datetime(self, s: pd.Series, rule: ValidationRule):
+        """Vectorized datetime validation (mirrors _validate_datetime)."""
+        stripped = s.fillna("").astype(str).str.strip()
+        cleaned = stripped.where(stripped != "", None)
+
+        # Date-only values (len 10) pass through; parse the rest
+        needs_parse = (stripped != "") & (stripped.str.len() != 10)
+        if needs_parse.any():
+            sub = stripped[needs_parse]
+            parsed = pd.to_datetime(sub, format=_DATETIME_FMTS[0], errors="coerce")
+            for fmt in _DATETIME_FMTS[1:]:
+                mask = parsed.isna()
+                if not mask.any():
+                    break
+                parsed[mask] = pd.to_datetime(sub[mask], format=fmt, errors="coerce")
+            # Unparseable values keep their raw string (as in the scalar path)
+            iso = parsed.dt.strftime("%Y-%m-%dT%H:%M:%S").dropna()
+            cleaned.update(iso)
+
+        return cleaned, None
+
+    def _vector_clean_text(self, s: pd.Series, rule: ValidationRule):
+        """Vectorized text cleaning (mirrors _validate_text)."""
+        cleaned = s.fillna("").astype(str).str.strip().str.replace(_WS_RE, " ", regex=True)
+        return cleaned.where(cleaned != "", None), None
+
+    def _vector_non_negative_number(self, s: pd.Series, rule: ValidationRule):
+        """Vectorized non-negative check (mirrors _validate_non_negative)."""
+        nums = pd.to_numeric(s, errors="coerce")
+        # Negatives and unparseable values become NULL, matching the scalar path
+        return nums.where(nums >= 0, None), None
+
+    def _vector_yes_no_flag(self, s: pd.Series, rule: ValidationRule):
+        """Vectorized Yes/No mapping (mirrors _validate_yes_no)."""
+        upper = s.fillna("").astype(str).str.strip().str.upper()
+        mapped = upper.map({
+            "YES": 1, "Y": 1, "TRUE": 1, "1": 1,
+            "NO": 0, "N": 0, "FALSE": 0, "0": 0, "": 0
+        })
+        return mapped.fillna(rule.default_value or 0).astype("int8"), None
+
+    def _vector_binary_flag(self, s: pd.Series, rule: ValidationRule):
+        """Vectorized binary (0/1) check (mirrors _validate_binary)."""
+        nums = pd.to_numeric(s, errors="coerce")
+        valid = nums.isin((0, 1))
+        return nums.where(valid, rule.default_value or 0).fillna(0).astype("int8"), None
+
     def _clean_value(self, value: Any) -> Any:
         """Basic value cleaning - trim strings, handle None."""
         if value is None:
@@ -186,16 +413,9 @@ class DataQualityValidator:
 
         try:
             if isinstance(value, str):
-                # Try common formats
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d"]:
-                    try:
-                        parsed = datetime.strptime(value.strip(), fmt)
-                        return ValidationResult(
-                            is_valid=True,
-                            cleaned_value=parsed.strftime("%Y-%m-%d")
-                        )
-                    except ValueError:
-                        continue
+                iso = _parse_date_cached(value.strip())
+                if iso is not None:
+                    return ValidationResult(is_valid=True, cleaned_value=iso)
 
                 return ValidationResult(
                     is_valid=False,
@@ -215,7 +435,7 @@ class DataQualityValidator:
     def _validate_datetime(self, value: Any) -> ValidationResult:
         """Validate datetime field."""
         if value is None or (isinstance(value, str) and not value.strip()):
-            return ValidationResult(is_valid=True, cleaned_value=None)
+            return _OK_NONE
 
         try:
             if isinstance(value, str):
@@ -224,31 +444,24 @@ class DataQualityValidator:
                 if len(value) == 10:  # YYYY-MM-DD
                     return ValidationResult(is_valid=True, cleaned_value=value)
 
-                # Try datetime formats
-                for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%m/%d/%Y %H:%M"]:
-                    try:
-                        parsed = datetime.strptime(value, fmt)
-                        return ValidationResult(
-                            is_valid=True,
-                            cleaned_value=parsed.isoformat()
-                        )
-                    except ValueError:
-                        continue
+                iso = _parse_datetime_cached(value)
+                if iso is not None:
+                    return ValidationResult(is_valid=True, cleaned_value=iso)
 
             return ValidationResult(is_valid=True, cleaned_value=str(value))
 
         except Exception:
-            return ValidationResult(is_valid=True, cleaned_value=None)
+            return _OK_NONE
 
     def _validate_text(self, value: Any) -> ValidationResult:
         """Validate and clean text field."""
         if value is None:
-            return ValidationResult(is_valid=True, cleaned_value=None)
+            return _OK_NONE
 
         if isinstance(value, str):
             cleaned = value.strip()
             # Remove excessive whitespace
-            cleaned = re.sub(r'\s+', ' ', cleaned)
+            cleaned = _WS_RE.sub(' ', cleaned)
             return ValidationResult(
                 is_valid=True,
                 cleaned_value=cleaned if cleaned else None
@@ -259,7 +472,7 @@ class DataQualityValidator:
     def _validate_non_negative(self, value: Any) -> ValidationResult:
         """Validate numeric field is non-negative."""
         if value is None or (isinstance(value, str) and not value.strip()):
-            return ValidationResult(is_valid=True, cleaned_value=None)
+            return _OK_NONE
 
         try:
             num = float(value)
@@ -282,18 +495,15 @@ class DataQualityValidator:
 
     def _validate_yes_no(self, value: Any) -> ValidationResult:
         """Validate Yes/No field, convert to 1/0."""
-        if value is None or (isinstance(value, str) and not value.strip()):
-            return ValidationResult(is_valid=True, cleaned_value=0)
+        if value is None:
+            return _OK_ZERO
 
         if isinstance(value, str):
-            upper = value.strip().upper()
-            if upper in ("YES", "Y", "TRUE", "1"):
-                return ValidationResult(is_valid=True, cleaned_value=1)
-            elif upper in ("NO", "N", "FALSE", "0", ""):
-                return ValidationResult(is_valid=True, cleaned_value=0)
-
-        if isinstance(value, (int, float)):
-            return ValidationResult(is_valid=True, cleaned_value=1 if value else 0)
+            mapped = _YESNO_MAP.get(value.strip().upper())
+            if mapped is not None:
+                return _OK_ONE if mapped else _OK_ZERO
+        elif isinstance(value, (int, float)):
+            return _OK_ONE if value else _OK_ZERO
 
         return ValidationResult(
             is_valid=False,
@@ -304,8 +514,13 @@ class DataQualityValidator:
 
     def _validate_binary(self, value: Any) -> ValidationResult:
         """Validate binary (0/1) field."""
-        if value is None or (isinstance(value, str) and not value.strip()):
-            return ValidationResult(is_valid=True, cleaned_value=0)
+        if value is None:
+            return _OK_ZERO
+
+        if isinstance(value, str):
+            mapped = _BINARY_MAP.get(value.strip())
+            if mapped is not None:
+                return _OK_ONE if mapped else _OK_ZERO
 
         try:
             num = int(float(value))
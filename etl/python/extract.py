@@ -5,12 +5,18 @@ Author: J. Ryan Butcher
 Handles reading source CSV files with chunked processing for memory efficiency.
 """
 
+import io
 import os
+import re
 import csv
+import sys
+from collections import namedtuple
 from pathlib import Path
 from typing import Iterator, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
+import pandas as pd
+
 from config import get_config
 
 
@@ -24,18 +30,66 @@ class ExtractionResult:
     error_message: str = None
 
 
+# Block size for buffered reads - large sequential blocks amortize
+# syscall overhead on multi-GB source files
+_READ_BLOCK_SIZE = 1 << 20  # 1 MiB
+
+
 def count_csv_rows(file_path: str) -> int:
     """
     Count total rows in CSV file (excluding header).
 
+    Counts newlines in large binary blocks via bytes.count (C loop)
+    instead of iterating lines in Python.
+
     Args:
         file_path: Path to CSV file
 
     Returns:
         Number of data rows
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return sum(1 for _ in f) - 1  # Subtract header
+    with open(file_path, 'rb') as f:
+        count = 0
+        last_byte = b''
+        buf = f.read(_READ_BLOCK_SIZE)
+        while buf:
+            count += buf.count(b'\n')
+            last_byte = buf[-1:]
+            buf = f.read(_READ_BLOCK_SIZE)
+    if last_byte and last_byte != b'\n':
+        count += 1  # Final line without trailing newline
+    return max(0, count - 1)  # Subtract header
+
+
+def _scan_csv(file_path: str) -> Tuple[List[str], int]:
+    """
+    Read header columns and count data rows in a single pass.
+
+    Opens the file once: parses the header from the first line, then
+    counts remaining newlines block-wise. One descriptor, one traversal.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        Tuple of (column names, number of data rows)
+    """
+    with open(file_path, 'rb', buffering=_READ_BLOCK_SIZE) as f:
+        header_line = f.readline()
+        columns = next(csv.reader([header_line.decode('utf-8').rstrip('\r\n')]))
+
+        count = 0
+        last_byte = b''
+        buf = f.read(_READ_BLOCK_SIZE)
+        while buf:
+            count += buf.count(b'\n')
+            last_byte = buf[-1:]
+            buf = f.read(_READ_BLOCK_SIZE)
+
+    if last_byte and last_byte != b'\n':
+        count += 1  # Final line without trailing newline
+
+    return columns, count
 
 
 def get_csv_columns(file_path: str) -> List[str]:
@@ -48,9 +102,11 @@ def get_csv_columns(file_path: str) -> List[str]:
     Returns:
         List of column names
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'rb', buffering=_READ_BLOCK_SIZE) as fh:
+        f = io.TextIOWrapper(fh, encoding='utf-8', newline='')
         reader = csv.reader(f)
-        return next(reader)
+        # Interned names make per-row dict key hashing an identity check
+        return [sys.intern(c) for c in next(reader)]
 
 
 def extract_csv_chunks(
@@ -70,14 +126,19 @@ def extract_csv_chunks(
     config = get_config()
     chunk_size = chunk_size or config.etl.batch_size
 
-    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+    with open(file_path, 'rb', buffering=_READ_BLOCK_SIZE) as fh:
+        f = io.TextIOWrapper(fh, encoding='utf-8', newline='')
         reader = csv.DictReader(f)
+        if reader.fieldnames:
+            # Intern header names once so row-dict probes short-circuit
+            # on pointer equality
+            reader.fieldnames = [sys.intern(c) for c in reader.fieldnames]
         chunk = []
         row_num = 1  # Start after header
 
+        # Row numbers derive from the chunk start (start + offset), so no
+        # per-row dict write is needed for tracing
         for row in reader:
-            # Add row number for tracing
-            row['_source_row_num'] = row_num
             chunk.append(row)
             row_num += 1
 
@@ -90,6 +151,222 @@ def extract_csv_chunks(
             yield chunk, row_num - len(chunk)
 
 
+def _sanitize_field_name(name: str) -> str:
+    """Sanitize a CSV header into a valid namedtuple field name."""
+    cleaned = re.sub(r'\W', '_', name.strip())
+    if not cleaned or cleaned[0].isdigit() or cleaned.startswith('_'):
+        cleaned = f"col{cleaned}" if cleaned.startswith('_') else f"col_{cleaned}"
+    return cleaned
+
+
+def extract_csv_chunk_tuples(
+    file_path: str,
+    chunk_size: int = None
+) -> Iterator[Tuple[List[tuple], int]]:
+    """
+    Extract CSV data as chunks of namedtuple rows.
+
+    A namedtuple built once from the header replaces the per-row dict
+    allocation of csv.DictReader - one object creation per row instead
+    of a dict plus a hash insert per column. Rows carry the source row
+    number as a trailing 'source_row_num' field; callers that need a
+    dict can call row._asdict().
+
+    Args:
+        file_path: Path to source CSV file
+        chunk_size: Number of rows per chunk (uses config default if None)
+
+    Yields:
+        Tuple of (list of namedtuple rows, starting row number)
+    """
+    config = get_config()
+    chunk_size = chunk_size or config.etl.batch_size
+
+    with open(file_path, 'rb', buffering=_READ_BLOCK_SIZE) as fh:
+        f = io.TextIOWrapper(fh, encoding='utf-8', newline='')
+        reader = csv.reader(f)
+        header = next(reader)
+        n_cols = len(header)
+
+        Row = namedtuple(
+            "Row",
+            [_sanitize_field_name(h) for h in header] + ["source_row_num"]
+        )
+
+        chunk = []
+        row_num = 1  # Start after header
+
+        for row in reader:
+            # Pad/truncate ragged rows to the header width
+            if len(row) != n_cols:
+                row = (row + [None] * n_cols)[:n_cols]
+            chunk.append(Row(*row, row_num))
+            row_num += 1
+
+            if len(chunk) >= chunk_size:
+                yield chunk, row_num - len(chunk)
+                chunk = []
+
+        if chunk:
+            yield chunk, row_num - len(chunk)
+
+
+def extract_csv_chunks_df(
+    file_path: str,
+    chunk_size: int = None
+) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """
+    Extract CSV data as DataFrame chunks for vectorized validation.
+
+    Keeps values as raw strings so downstream cleaning/typing happens in
+    one vectorized pass (see DataQualityValidator.validate_chunk) instead
+    of per-row dict loops.
+
+    Args:
+        file_path: Path to source CSV file
+        chunk_size: Number of rows per chunk (uses config default if None)
+
+    Yields:
+        Tuple of (DataFrame indexed by source row number, starting row number)
+    """
+    config = get_config()
+    chunk_size = chunk_size or config.etl.batch_size
+
+    row_num = 1  # Start after header
+    for df in pd.read_csv(file_path, chunksize=chunk_size, dtype=str):
+        df.index = range(row_num, row_num + len(df))
+        yield df, row_num
+        row_num += len(df)
+
+
+def extract_csv_arrow_batches(
+    file_path: str,
+    chunk_size: int = None,
+    avg_row_bytes: int = 256
+):
+    """
+    Extract CSV data as Arrow RecordBatches via pyarrow's streaming reader.
+
+    pyarrow parses CSV in multithreaded C++ and keeps values in columnar
+    buffers, avoiding the per-row dict/str allocation of csv.DictReader.
+    Callers that want a DataFrame can convert each batch with .to_pandas().
+
+    Args:
+        file_path: Path to source CSV file
+        chunk_size: Approximate rows per batch (uses config default if None)
+        avg_row_bytes: Estimated bytes per row used to size read blocks
+
+    Yields:
+        pyarrow.RecordBatch instances
+    """
+    import pyarrow.csv as pacsv
+
+    config = get_config()
+    chunk_size = chunk_size or config.etl.batch_size
+
+    read_options = pacsv.ReadOptions(block_size=chunk_size * avg_row_bytes)
+    convert_options = pacsv.ConvertOptions(
+        # Keep everything as strings; typing happens in the transform layer
+        column_types={col: "string" for col in get_csv_columns(file_path)}
+    )
+
+    with pacsv.open_csv(
+        file_path,
+        read_options=read_options,
+        convert_options=convert_options
+    ) as reader:
+        for batch in reader:
+            yield batch
+
+
+def estimate_csv_rows(file_path: str) -> int:
+    """
+    Estimate data-row count from file size without a full scan.
+
+    Samples average row length over the first block and divides the file
+    size by it - O(1) I/O where count_csv_rows reads the whole file.
+    Good enough for progress bars and worker sizing; exact counts still
+    come from count_csv_rows.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        Estimated number of data rows (at least 1 for a non-empty file)
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        sample = f.read(_READ_BLOCK_SIZE)
+
+    data_size = file_size - len(header)
+    if data_size <= 0:
+        return 0
+
+    sample_rows = sample.count(b'\n')
+    if sample_rows == 0:
+        return 1
+    avg_row_bytes = len(sample) / sample_rows
+    return max(1, round(data_size / avg_row_bytes))
+
+
+def split_csv_byte_ranges(
+    file_path: str,
+    workers: int
+) -> List[Tuple[int, int, int]]:
+    """
+    Split a CSV into newline-aligned byte ranges for parallel staging.
+
+    Each approximate boundary is advanced to the next newline so no row
+    straddles two ranges; the starting source row number of each range
+    comes from one sequential newline count over the data region.
+
+    Args:
+        file_path: Path to source CSV file
+        workers: Desired number of ranges
+
+    Returns:
+        List of (byte_start, byte_end, start_row) tuples covering every
+        data row after the header; start_row is 1-based
+    """
+    file_size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        f.readline()  # Skip header
+        data_start = f.tell()
+        span = max(1, (file_size - data_start) // max(1, workers))
+
+        boundaries = [data_start]
+        for i in range(1, workers):
+            target = data_start + i * span
+            if target >= file_size:
+                break
+            f.seek(target)
+            f.readline()  # Align forward to the next row boundary
+            pos = f.tell()
+            if boundaries[-1] < pos < file_size:
+                boundaries.append(pos)
+        boundaries.append(file_size)
+
+        ranges = []
+        row_num = 1
+        f.seek(data_start)
+        for start, end in zip(boundaries, boundaries[1:]):
+            ranges.append((start, end, row_num))
+            remaining = end - start
+            while remaining:
+                block = f.read(min(_READ_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                row_num += block.count(b'\n')
+                remaining -= len(block)
+    return ranges
+
+
+# Directory listing cache keyed by (dir, pattern, dir mtime_ns) -
+# repeat scans of an unchanged source directory are free
+_dir_listing_cache: Dict[Tuple[str, str, int], List[str]] = {}
+
+
 def find_source_files(pattern: str = "*.csv") -> List[str]:
     """
     Find source files matching pattern in configured source directory.
@@ -100,22 +377,45 @@ def find_source_files(pattern: str = "*.csv") -> List[str]:
     Returns:
         List of absolute file paths
     """
+    import fnmatch
+
     config = get_config()
     source_dir = Path(config.etl.source_path)
 
     if not source_dir.exists():
         raise FileNotFoundError(f"Source directory not found: {source_dir}")
 
-    files = list(source_dir.glob(pattern))
-    return [str(f.absolute()) for f in files]
+    cache_key = (str(source_dir), pattern, source_dir.stat().st_mtime_ns)
+    cached = _dir_listing_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    # os.scandir returns DirEntry objects with cached stat info,
+    # avoiding the extra stat calls Path.glob can trigger
+    abs_dir = os.path.abspath(source_dir)
+    with os.scandir(source_dir) as it:
+        names = [entry.name for entry in it if entry.is_file()]
+
+    files = [
+        os.path.join(abs_dir, name)
+        for name in sorted(fnmatch.filter(names, pattern))
+    ]
+    _dir_listing_cache[cache_key] = files
+    return list(files)
 
 
-def validate_source_file(file_path: str) -> ExtractionResult:
+def validate_source_file(
+    file_path: str,
+    fast_count: bool = False
+) -> ExtractionResult:
     """
     Validate source file exists and is readable.
 
     Args:
         file_path: Path to source file
+        fast_count: Estimate total_rows from file size instead of
+            scanning the whole file (halves pre-Step-3 I/O; progress
+            totals become approximate)
 
     Returns:
         ExtractionResult with validation status
@@ -141,8 +441,12 @@ def validate_source_file(file_path: str) -> ExtractionResult:
         )
 
     try:
-        columns = get_csv_columns(file_path)
-        total_rows = count_csv_rows(file_path)
+        if fast_count:
+            columns = get_csv_columns(file_path)
+            total_rows = estimate_csv_rows(file_path)
+        else:
+            # Single pass: header + row count from one open file handle
+            columns, total_rows = _scan_csv(file_path)
 
         return ExtractionResult(
             file_path=file_path,
@@ -161,10 +465,35 @@ def validate_source_file(file_path: str) -> ExtractionResult:
         )
 
 
+def _copy_file_fast(src: str, dst: str):
+    """
+    Copy a file across filesystems without userspace byte shuffling.
+
+    Uses os.sendfile on Linux (kernel-space copy); falls back to
+    shutil.copyfileobj with a large buffer elsewhere.
+    """
+    import shutil
+
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        if hasattr(os, 'sendfile'):
+            offset = 0
+            size = os.fstat(s.fileno()).st_size
+            while offset < size:
+                sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                if not sent:
+                    break
+                offset += sent
+        else:
+            shutil.copyfileobj(s, d, length=_READ_BLOCK_SIZE)
+
+
 def archive_source_file(file_path: str) -> str:
     """
     Move source file to archive directory with timestamp.
 
+    Same-filesystem moves are a single rename; cross-filesystem moves
+    copy via the kernel (sendfile) instead of a Python byte loop.
+
     Args:
         file_path: Path to source file
 
@@ -182,7 +511,13 @@ def archive_source_file(file_path: str) -> str:
     archive_name = f"{source.stem}_{timestamp}{source.suffix}"
     archive_path = archive_dir / archive_name
 
-    source.rename(archive_path)
+    try:
+        os.rename(source, archive_path)
+    except OSError:
+        # Cross-filesystem move (EXDEV): copy then unlink
+        _copy_file_fast(str(source), str(archive_path))
+        os.unlink(source)
+
     return str(archive_path)
 
 
@@ -204,6 +539,6 @@ if __name__ == "__main__":
     if result.success:
         print("\nFirst chunk preview:")
         for chunk, start_row in extract_csv_chunks(file_path, chunk_size=5):
-            for row in chunk[:2]:
-                print(f"  Row {row['_source_row_num']}: {row.get('INCIDENT_DT')} - {row.get('INCIDENT_COUNTY')}")
+            for i, row in enumerate(chunk[:2]):
+                print(f"  Row {start_row + i}: {row.get('INCIDENT_DT')} - {row.get('INCIDENT_COUNTY')}")
             break
@@ -5,8 +5,11 @@ Author: J. Ryan Butcher
 Provides structured logging to both database and file/console.
 """
 
+import os
 import sqlite3
 import logging
+import logging.handlers
+import threading
 from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
@@ -15,6 +18,66 @@ from contextlib import contextmanager
 
 from config import get_config
 
+# Bound once at import: saves the module-attribute lookup on every call
+# in the hot error path
+_now = datetime.now
+
+
+def _open(db_path: str) -> sqlite3.Connection:
+    """
+    Open a connection with the pipeline's write pragmas applied.
+
+    Mirrors the fact loader: WAL keeps the many tiny log INSERT/UPDATEs
+    from blocking other writers, and synchronous=NORMAL removes the
+    per-commit fsync. In-memory databases skip WAL (unsupported).
+
+    Args:
+        db_path: Path to SQLite database
+
+    Returns:
+        Configured sqlite3 connection
+    """
+    conn = sqlite3.connect(
+        db_path, check_same_thread=False, isolation_level=None,
+        cached_statements=256
+    )
+    if db_path != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
+# Statement text as module constants: the connection's statement cache is
+# keyed by SQL string, so stable objects guarantee the prepared VDBE
+# programs are reused instead of re-parsed on every log event
+_INSERT_RUN_SQL = """
+    INSERT INTO ETL_RUN_LOG (run_start_dt, source_file, environment, load_type)
+    VALUES (?, ?, ?, ?)
+"""
+
+_UPDATE_RUN_SQL = """
+    UPDATE ETL_RUN_LOG
+    SET run_end_dt = ?, status = ?, source_row_count = ?, error_message = ?
+    WHERE run_id = ?
+"""
+
+_INSERT_STEP_SQL = """
+    INSERT INTO ETL_STEP_LOG
+    (run_id, step_name, step_order, step_start_dt, step_end_dt, status,
+     rows_read, rows_inserted, rows_updated, rows_rejected, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ERROR_SQL = """
+    INSERT INTO ETL_ERROR_LOG
+    (run_id, step_name, error_dt, source_row_num, error_type,
+     error_message, column_name, column_value, source_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 @dataclass
 class StepMetrics:
@@ -62,6 +125,20 @@ class ETLLogger:
         self.run_id: Optional[int] = None
         self.step_order: int = 0
         self.errors: List[ErrorRecord] = []
+        self._current_step: Optional[str] = None
+
+        # Single writer connection for the logger's lifetime; every log
+        # write used to open/commit/close its own connection, which
+        # dominated logging cost. The lock serializes writes when steps
+        # log from worker threads; reads go through _read_connection.
+        self._conn = _open(self.db_path)
+        self._lock = threading.Lock()
+
+        # Error rows are buffered and flushed with executemany in one
+        # transaction; a dirty file can reject tens of thousands of rows
+        # and one INSERT+fsync per error dominated those runs
+        self._error_buffer: List[tuple] = []
+        self._error_flush_threshold = 1000
 
         # Ensure logging tables exist
         self._init_logging_tables()
@@ -71,17 +148,35 @@ class ETLLogger:
         self.logger = logging.getLogger("ems_etl")
         self.logger.setLevel(getattr(logging, config.logging.level))
 
+        # "ems_etl" is process-wide; if a previous ETLLogger already
+        # configured it for the same file, adopt its handlers instead of
+        # tearing down and recreating them (repeat construction in tests
+        # and re-init paths otherwise churns handlers and filesystem)
+        log_path = Path(config.logging.log_file)
+        target_file = os.path.abspath(config.logging.log_file)
+        for handler in self.logger.handlers:
+            if (isinstance(handler, logging.handlers.MemoryHandler)
+                    and isinstance(handler.target, logging.FileHandler)
+                    and handler.target.baseFilename == target_file):
+                self._mem_handler = handler
+                return
+
         # Clear existing handlers
         self.logger.handlers = []
 
-        # File handler
-        log_path = Path(config.logging.log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        # File handler, buffered: a MemoryHandler batches records into a
+        # few large writes instead of a write syscall per log call, and
+        # flushes immediately on ERROR so failures hit disk right away
+        if not log_path.parent.exists():
+            log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_path)
         file_handler.setFormatter(
             logging.Formatter("%(asctime)s | %(levelname)-8s | %(message)s")
         )
-        self.logger.addHandler(file_handler)
+        self._mem_handler = logging.handlers.MemoryHandler(
+            capacity=512, flushLevel=logging.ERROR, target=file_handler
+        )
+        self.logger.addHandler(self._mem_handler)
 
         # Console handler
         if config.logging.console_output:
@@ -93,8 +188,10 @@ class ETLLogger:
 
     def _init_logging_tables(self):
         """Create logging tables if they don't exist."""
-        with self._get_connection() as conn:
-            conn.executescript("""
+        # executescript manages its own transaction, so it bypasses the
+        # BEGIN/COMMIT wrapper in _get_connection
+        with self._lock:
+            self._conn.executescript("""
                 CREATE TABLE IF NOT EXISTS ETL_RUN_LOG (
                     run_id INTEGER PRIMARY KEY AUTOINCREMENT,
                     run_start_dt TEXT NOT NULL,
@@ -143,14 +240,62 @@ class ETLLogger:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
+        """Yield the cached connection inside a locked transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    @contextmanager
+    def _read_connection(self):
+        """
+        Yield a read-only connection for status queries.
+
+        Under WAL, readers never block the writer (or vice versa), so
+        status lookups open their own mode=ro connection instead of
+        queueing behind the writer lock.
+        """
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
         try:
             yield conn
-            conn.commit()
         finally:
             conn.close()
 
+    def get_current_step(self) -> Optional[str]:
+        """Name of the step currently executing, or None between steps."""
+        return self._current_step
+
+    def get_run_status(self, run_id: int = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the run log row for a run without touching the writer.
+
+        Args:
+            run_id: Run to look up (defaults to the current run)
+
+        Returns:
+            Run log row as a dict, or None if not found
+        """
+        run_id = run_id if run_id is not None else self.run_id
+        if run_id is None:
+            return None
+
+        with self._read_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT * FROM ETL_RUN_LOG WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def close(self):
+        """Flush buffered log records and close the database connection."""
+        self._mem_handler.flush()
+        self._flush_errors()
+        self._conn.close()
+
     def start_run(
         self,
         source_file: str,
@@ -170,11 +315,8 @@ class ETLLogger:
         """
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO ETL_RUN_LOG (run_start_dt, source_file, environment, load_type)
-                VALUES (?, ?, ?, ?)
-                """,
-                (datetime.now().isoformat(), source_file, environment, load_type)
+                _INSERT_RUN_SQL,
+                (_now().isoformat(), source_file, environment, load_type)
             )
             self.run_id = cursor.lastrowid
 
@@ -204,14 +346,12 @@ class ETLLogger:
         if self.run_id is None:
             return
 
+        self._flush_errors()
+
         with self._get_connection() as conn:
             conn.execute(
-                """
-                UPDATE ETL_RUN_LOG
-                SET run_end_dt = ?, status = ?, source_row_count = ?, error_message = ?
-                WHERE run_id = ?
-                """,
-                (datetime.now().isoformat(), status, source_row_count, error_message, self.run_id)
+                _UPDATE_RUN_SQL,
+                (_now().isoformat(), status, source_row_count, error_message, self.run_id)
             )
 
         self.logger.info(f"{'=' * 60}")
@@ -221,6 +361,7 @@ class ETLLogger:
         if error_message:
             self.logger.error(f"Error: {error_message}")
         self.logger.info(f"{'=' * 60}")
+        self._mem_handler.flush()
 
     @contextmanager
     def step(self, step_name: str):
@@ -234,22 +375,15 @@ class ETLLogger:
             StepMetrics instance to update during step
         """
         self.step_order += 1
-        step_start = datetime.now()
+        step_start = _now()
         metrics = StepMetrics()
 
         self.logger.info(f"[Step {self.step_order}] {step_name} - Starting...")
 
-        # Insert step start record
-        step_log_id = None
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO ETL_STEP_LOG (run_id, step_name, step_order, step_start_dt)
-                VALUES (?, ?, ?, ?)
-                """,
-                (self.run_id, step_name, self.step_order, step_start.isoformat())
-            )
-            step_log_id = cursor.lastrowid
+        # The step row is written once on completion; a start INSERT plus
+        # end UPDATE was two transactions for a row nothing reads while
+        # RUNNING. get_current_step() serves live status from memory.
+        self._current_step = step_name
 
         try:
             yield metrics
@@ -262,22 +396,20 @@ class ETLLogger:
             raise
         finally:
             # Update step end record
-            step_end = datetime.now()
+            step_end = _now()
             duration = (step_end - step_start).total_seconds()
 
+            self._flush_errors()
+            self._current_step = None
+
             with self._get_connection() as conn:
                 conn.execute(
-                    """
-                    UPDATE ETL_STEP_LOG
-                    SET step_end_dt = ?, status = ?,
-                        rows_read = ?, rows_inserted = ?, rows_updated = ?,
-                        rows_rejected = ?, error_message = ?
-                    WHERE step_log_id = ?
-                    """,
+                    _INSERT_STEP_SQL,
                     (
-                        step_end.isoformat(), status,
+                        self.run_id, step_name, self.step_order,
+                        step_start.isoformat(), step_end.isoformat(), status,
                         metrics.rows_read, metrics.rows_inserted, metrics.rows_updated,
-                        metrics.rows_rejected, error_msg, step_log_id
+                        metrics.rows_rejected, error_msg
                     )
                 )
 
@@ -288,6 +420,7 @@ class ETLLogger:
                 f"Inserted: {metrics.rows_inserted:,} | "
                 f"Rejected: {metrics.rows_rejected:,}"
             )
+            self._mem_handler.flush()
 
     def log_error(
         self,
@@ -303,20 +436,28 @@ class ETLLogger:
         """
         self.errors.append(error)
 
+        # No timestamp here: _flush_errors stamps the whole flush once,
+        # since sub-second ordering of bulk rejects is not meaningful
+        self._error_buffer.append((
+            self.run_id, step_name,
+            error.source_row_num, error.error_type, error.error_message,
+            error.column_name, error.column_value, error.source_data
+        ))
+        if len(self._error_buffer) >= self._error_flush_threshold:
+            self._flush_errors()
+
+    def _flush_errors(self):
+        """Write buffered error rows in a single executemany transaction."""
+        if not self._error_buffer:
+            return
+
+        now = _now().isoformat()
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO ETL_ERROR_LOG
-                (run_id, step_name, error_dt, source_row_num, error_type,
-                 error_message, column_name, column_value, source_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    self.run_id, step_name, datetime.now().isoformat(),
-                    error.source_row_num, error.error_type, error.error_message,
-                    error.column_name, error.column_value, error.source_data
-                )
+            conn.executemany(
+                _INSERT_ERROR_SQL,
+                (row[:2] + (now,) + row[2:] for row in self._error_buffer)
             )
+        self._error_buffer.clear()
 
     def info(self, message: str):
         """Log info message."""
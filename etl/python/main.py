@@ -13,8 +13,11 @@ Example:
     python main.py --env dev --file ./data/input/ems_runs_2024.csv --full
 """
 
+import os
 import sys
+import queue
 import argparse
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -23,11 +26,21 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import get_config, Config
-from extract import extract_csv_chunks, validate_source_file, find_source_files
-from stage import init_staging_table, stage_records, get_staging_count
-from transform import transform_record
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from extract import (
+    extract_csv_chunks_df, split_csv_byte_ranges,
+    validate_source_file, find_source_files
+)
+from stage import (
+    init_staging_table, finalize_staging_indexes, stage_records,
+    stage_csv_range, get_staging_count
+)
+from transform import transform_batch_df
 from tqdm import tqdm
 
+import pandas as pd
+
 
 # Import dimension and fact loaders
 try:
@@ -50,6 +63,8 @@ try:
     init_fact_table = load_facts.init_fact_table
     truncate_fact_table = load_facts.truncate_fact_table
     load_fact_batch = load_facts.load_fact_batch
+    load_facts_from_staging = load_facts.load_facts_from_staging
+    load_fact_json = load_facts.load_fact_json
     get_fact_count = load_facts.get_fact_count
     get_fact_summary = load_facts.get_fact_summary
     ETLLogger = logging_utils.ETLLogger
@@ -62,18 +77,143 @@ except Exception as e:
     ETLLogger = None
 
 
+# Dimension name -> cleaned-record fields resolved against it; drives
+# the batched lookups in resolve_dimensions_bulk
+_DIM_FIELDS = (
+    ("county", ("incident_county",)),
+    ("complaint", ("chief_complaint_dispatch",)),
+    ("anatomic", ("chief_complaint_anatomic_loc",)),
+    ("symptom", ("primary_symptom",)),
+    ("impression", ("provider_impression_primary",)),
+    ("disposition", ("disposition_ed", "disposition_hospital")),
+    ("destination", ("destination_type",)),
+    ("service_level", ("provider_type_service_level",)),
+)
+
+
+def resolve_dimensions_frame(cleaned: pd.DataFrame, dim_loader):
+    """
+    Resolve every dimension key a cleaned chunk needs.
+
+    One resolve_many call per dimension over the chunk's distinct values
+    (plus one upsert per distinct provider structure/service pair)
+    replaces ~10 get_or_create round trips per row; fact-record
+    construction afterwards maps whole columns against the loader caches.
+
+    Args:
+        cleaned: Cleaned chunk from transform_batch_df
+        dim_loader: DimensionLoader whose caches to populate
+    """
+    for dim, fields in _DIM_FIELDS:
+        values = set()
+        for field in fields:
+            values.update(value for value in cleaned[field].unique() if value)
+        if values:
+            dim_loader.resolve_many(dim, values)
+
+    org_pairs = {
+        (structure, service)
+        for structure, service in zip(
+            cleaned["provider_type_structure"], cleaned["provider_type_service"]
+        )
+        if structure
+    }
+    for structure, service in org_pairs:
+        dim_loader.get_or_create_provider_org(structure, service)
+
+
+# Fact key column -> (dimension, cleaned natural-key column)
+_FACT_DIM_KEYS = (
+    ("county_key", "county", "incident_county"),
+    ("chief_complaint_key", "complaint", "chief_complaint_dispatch"),
+    ("anatomic_location_key", "anatomic", "chief_complaint_anatomic_loc"),
+    ("symptom_key", "symptom", "primary_symptom"),
+    ("provider_impression_key", "impression", "provider_impression_primary"),
+    ("disposition_ed_key", "disposition", "disposition_ed"),
+    ("disposition_hospital_key", "disposition", "disposition_hospital"),
+    ("destination_type_key", "destination", "destination_type"),
+    ("service_level_key", "service_level", "provider_type_service_level"),
+)
+
+# Cleaned columns copied into the fact record unchanged
+_FACT_COPY_FIELDS = (
+    "date_key", "time_of_day_key",
+    "provider_to_scene_mins", "provider_to_dest_mins",
+    "dispatch_to_arrival_mins", "arrival_to_patient_mins",
+    "scene_time_mins", "total_call_time_mins",
+    "injury_flg", "naloxone_given_flg", "medication_given_flg",
+    "incident_count",
+    "unit_notified_dt", "unit_arrived_scene_dt", "unit_arrived_patient_dt",
+    "unit_left_scene_dt", "patient_arrived_dest_dt",
+    "_source_row_num",
+)
+
+
+def fact_records_from_frame(
+    cleaned: pd.DataFrame,
+    dim_caches: dict,
+    org_cache: dict
+) -> list:
+    """
+    Build fact-record dicts from a cleaned chunk.
+
+    Each dimension key resolves with one Series.map over the whole
+    column - a single C pass against the loader cache - instead of a
+    dict probe per row.
+
+    Args:
+        cleaned: Cleaned chunk from transform_batch_df (valid rows only)
+        dim_caches: Dimension name -> {natural key: surrogate key}
+        org_cache: (structure, service) -> provider_org_key
+
+    Returns:
+        List of fact record dicts with native Python values
+    """
+    fact = pd.DataFrame(index=cleaned.index)
+    for field in _FACT_COPY_FIELDS:
+        fact[field] = cleaned[field]
+
+    for key_col, dim, field in _FACT_DIM_KEYS:
+        fact[key_col] = (
+            cleaned[field].map(dim_caches[dim]).fillna(-1).astype("int64")
+        )
+
+    fact["provider_org_key"] = [
+        org_cache.get((structure, service or ""), -1) if structure else -1
+        for structure, service in zip(
+            cleaned["provider_type_structure"], cleaned["provider_type_service"]
+        )
+    ]
+
+    fact = fact.astype(object).where(fact.notna(), None)
+    return fact.to_dict("records")
+
+
 def run_etl(
     source_file: str,
     config: Config,
-    full_refresh: bool = True
+    full_refresh: bool = True,
+    stage_only: bool = False,
+    fast_count: bool = False
 ) -> bool:
     """
     Execute the full ETL pipeline.
 
+    Full-refresh loads skip the staging table and stream CSV chunks
+    straight into transform/load - the same work with half the disk I/O,
+    since every row is written once (to the fact table) instead of being
+    staged and re-read. Staging still runs for incremental loads and for
+    --stage-only reconciliation runs.
+
     Args:
         source_file: Path to source CSV file
         config: Configuration object
         full_refresh: If True, truncate and reload; if False, incremental
+        stage_only: If True, stop after staging (implies staging runs
+            even on a full refresh)
+        fast_count: Estimate the source row count from file size instead
+            of pre-scanning the whole file; progress totals become
+            approximate
 
     Returns:
         True if successful, False otherwise
@@ -83,6 +223,24 @@ def run_etl(
     # Ensure database directory exists
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+    # One connection serves staging DDL, the staging load, and the Step 5
+    # read loop; per-chunk open/close (and per-open PRAGMA re-application)
+    # disappears. Dimension and fact writers keep their own connections.
+    import sqlite3
+    # Autocommit mode: transactions are opened explicitly where batching
+    # matters, so the driver never issues its own implicit BEGIN per DML
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    # 8K pages cut B-tree depth for the scan-heavy staging workload;
+    # only takes effect on a freshly created database file
+    conn.execute("PRAGMA page_size=8192")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-262144")
+    # Serve sequential scans from memory-mapped pages (zero-copy via the
+    # OS page cache) instead of read() syscalls per page
+    conn.execute("PRAGMA mmap_size=268435456")
+
     # Initialize logger
     if ETLLogger:
         logger = ETLLogger(db_path)
@@ -101,33 +259,82 @@ def run_etl(
     try:
         # === Step 1: Validate Source ===
         print("\n[Step 1] Validating source file...")
-        validation = validate_source_file(source_file)
+        validation = validate_source_file(source_file, fast_count=fast_count)
 
         if not validation.success:
             raise ValueError(f"Source validation failed: {validation.error_message}")
 
         total_rows = validation.total_rows
-        print(f"  Source file valid: {total_rows:,} rows, {len(validation.columns)} columns")
+        rows_note = "~" if fast_count else ""
+        print(f"  Source file valid: {rows_note}{total_rows:,} rows, {len(validation.columns)} columns")
 
-        # === Step 2: Initialize Staging ===
-        print("\n[Step 2] Initializing staging table...")
-        init_staging_table(db_path)
-        print("  Staging table ready")
-
-        # === Step 3: Extract and Stage ===
-        print("\n[Step 3] Extracting and staging data...")
+        # === Steps 2-3: Staging ===
+        direct_load = full_refresh and not stage_only
         staged_count = 0
 
-        # Process in chunks with progress bar
-        for chunk, start_row in tqdm(
-            extract_csv_chunks(source_file, config.etl.batch_size),
-            total=(total_rows // config.etl.batch_size) + 1,
-            desc="  Staging"
-        ):
-            inserted = stage_records(chunk, Path(source_file).name, db_path)
-            staged_count += inserted
-
-        print(f"  Staged: {staged_count:,} records")
+        if direct_load:
+            print("\n[Step 2] Initializing staging table...")
+            print("  Skipped - full refresh streams source directly to facts")
+            print("\n[Step 3] Extracting and staging data...")
+            print("  Skipped - fused with Step 5")
+        else:
+            print("\n[Step 2] Initializing staging table...")
+            init_staging_table(db_path, conn=conn)
+            print("  Staging table ready")
+
+            print("\n[Step 3] Extracting and staging data...")
+
+            # Multi-batch files fan staging out across worker processes; each
+            # worker parses a newline-aligned byte range with pyarrow and
+            # writes through its own WAL connection. Small files stay serial -
+            # forking costs more than it saves below one batch per core.
+            workers = min(
+                os.cpu_count() or 1,
+                max(1, total_rows // config.etl.batch_size)
+            )
+            if workers > 1:
+                ranges = split_csv_byte_ranges(source_file, workers)
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(
+                            stage_csv_range, source_file, byte_start, byte_end,
+                            start_row, Path(source_file).name, db_path
+                        )
+                        for byte_start, byte_end, start_row in ranges
+                    ]
+                    for future in tqdm(
+                        as_completed(futures), total=len(futures), desc="  Staging"
+                    ):
+                        staged_count += future.result()
+            else:
+                # One transaction for the whole staging pass: each chunk becomes
+                # a plain executemany instead of its own commit+fsync
+                conn.execute("BEGIN")
+                for chunk, start_row in tqdm(
+                    extract_csv_chunks_df(source_file, config.etl.batch_size),
+                    total=(total_rows // config.etl.batch_size) + 1,
+                    desc="  Staging"
+                ):
+                    inserted = stage_records(
+                        chunk, Path(source_file).name, db_path,
+                        start_row=start_row, conn=conn
+                    )
+                    staged_count += inserted
+                conn.execute("COMMIT")
+
+            # Index builds once over the loaded table instead of
+            # incrementally during every insert above
+            finalize_staging_indexes(db_path, conn=conn)
+
+            print(f"  Staged: {staged_count:,} records")
+
+        if stage_only:
+            if logger:
+                logger.end_run("SUCCESS", total_rows)
+            print(f"\n{'=' * 60}")
+            print("Staging Completed Successfully!")
+            print(f"{'=' * 60}")
+            return True
 
         # === Step 4: Initialize Warehouse ===
         print("\n[Step 4] Initializing warehouse tables...")
@@ -154,92 +361,87 @@ def run_etl(
         # === Step 5: Transform and Load ===
         print("\n[Step 5] Transforming and loading facts...")
 
-        import sqlite3
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-
-        # Process staging in batches
+        # Process source in batches
         batch_size = config.etl.batch_size
-        offset = 0
         fact_count = 0
         rejected_count = 0
 
-        # Count staging records
-        cursor = conn.execute("SELECT COUNT(*) FROM STG_EMS_INCIDENT")
-        staging_total = cursor.fetchone()[0]
-
-        with tqdm(total=staging_total, desc="  Loading") as pbar:
-            while True:
-                cursor = conn.execute(
-                    f"SELECT * FROM STG_EMS_INCIDENT LIMIT {batch_size} OFFSET {offset}"
-                )
-                rows = cursor.fetchall()
-
-                if not rows:
-                    break
-
-                # Transform and prepare fact records
-                fact_records = []
-
-                for row in rows:
-                    record = dict(row)
-
-                    # Transform the record
-                    result = transform_record(record)
-
-                    if not result.is_valid:
-                        rejected_count += 1
+        if direct_load:
+            # Fused pipeline: CSV chunks feed the vectorized transform
+            # directly and STG_EMS_INCIDENT is never written or re-read.
+            # A single writer thread drains transformed batches from a
+            # bounded queue, overlapping Python transform CPU with
+            # SQLite write I/O (WAL serializes writers, so one writer;
+            # dimensions commit per chunk and briefly wait their turn).
+            if dim_loader:
+                dim_caches = {dim: dim_loader.cache_for(dim) for dim, _ in _DIM_FIELDS}
+                org_cache = dim_loader.provider_org_cache
+            else:
+                dim_caches = {dim: {} for dim, _ in _DIM_FIELDS}
+                org_cache = {}
+
+            batch_queue = queue.Queue(maxsize=4)
+            loaded_counts = []
+            writer_errors = []
+
+            def fact_writer():
+                failed = False
+                while True:
+                    batch = batch_queue.get()
+                    if batch is None:
+                        break
+                    if failed:
+                        # Keep draining to the sentinel so a blocked
+                        # producer put() can always complete; the error
+                        # is re-raised on the main thread after join
                         continue
-
-                    # Get dimension keys
-                    cleaned = result.cleaned_data
-                    derived = result.derived_data
-
-                    fact_record = {
-                        "date_key": derived["date_key"],
-                        "time_of_day_key": derived["time_of_day_key"],
-                        "county_key": dim_loader.get_or_create_county(cleaned["incident_county"]) if dim_loader else -1,
-                        "chief_complaint_key": dim_loader.get_or_create_complaint(cleaned["chief_complaint_dispatch"]) if dim_loader else -1,
-                        "anatomic_location_key": dim_loader.get_or_create_anatomic(cleaned["chief_complaint_anatomic_loc"]) if dim_loader else -1,
-                        "symptom_key": dim_loader.get_or_create_symptom(cleaned["primary_symptom"]) if dim_loader else -1,
-                        "provider_impression_key": dim_loader.get_or_create_impression(cleaned["provider_impression_primary"]) if dim_loader else -1,
-                        "disposition_ed_key": dim_loader.get_or_create_disposition(cleaned["disposition_ed"]) if dim_loader else -1,
-                        "disposition_hospital_key": dim_loader.get_or_create_disposition(cleaned["disposition_hospital"]) if dim_loader else -1,
-                        "destination_type_key": dim_loader.get_or_create_destination(cleaned["destination_type"]) if dim_loader else -1,
-                        "provider_org_key": dim_loader.get_or_create_provider_org(
-                            cleaned["provider_type_structure"],
-                            cleaned["provider_type_service"]
-                        ) if dim_loader else -1,
-                        "service_level_key": dim_loader.get_or_create_service_level(cleaned["provider_type_service_level"]) if dim_loader else -1,
-                        "provider_to_scene_mins": cleaned["provider_to_scene_mins"],
-                        "provider_to_dest_mins": cleaned["provider_to_dest_mins"],
-                        "dispatch_to_arrival_mins": derived["dispatch_to_arrival_mins"],
-                        "arrival_to_patient_mins": derived["arrival_to_patient_mins"],
-                        "scene_time_mins": derived["scene_time_mins"],
-                        "total_call_time_mins": derived["total_call_time_mins"],
-                        "injury_flg": cleaned["injury_flg"],
-                        "naloxone_given_flg": cleaned["naloxone_given_flg"],
-                        "medication_given_flg": cleaned["medication_given_flg"],
-                        "incident_count": derived["incident_count"],
-                        "unit_notified_dt": cleaned["unit_notified_dt"],
-                        "unit_arrived_scene_dt": cleaned["unit_arrived_scene_dt"],
-                        "unit_arrived_patient_dt": cleaned["unit_arrived_patient_dt"],
-                        "unit_left_scene_dt": cleaned["unit_left_scene_dt"],
-                        "patient_arrived_dest_dt": cleaned["patient_arrived_dest_dt"],
-                        "_source_row_num": cleaned["_source_row_num"]
-                    }
-
-                    fact_records.append(fact_record)
-
-                # Batch insert facts
-                if fact_records:
-                    inserted = load_fact_batch(fact_records, Path(source_file).name, db_path)
-                    fact_count += inserted
-
-                pbar.update(len(rows))
-                offset += batch_size
-
-        conn.close()
+                    try:
+                        loaded_counts.append(
+                            load_fact_json(batch, Path(source_file).name, db_path)
+                        )
+                    except Exception as exc:
+                        writer_errors.append(exc)
+                        failed = True
+
+            writer_thread = threading.Thread(target=fact_writer, daemon=True)
+            writer_thread.start()
+
+            with tqdm(total=total_rows, desc="  Loading") as pbar:
+                for df, start_row in extract_csv_chunks_df(source_file, batch_size):
+                    # Column-wise cleaning over the whole chunk, then
+                    # dimension keys mapped against the loader caches
+                    cleaned, rejected = transform_batch_df(df)
+                    rejected_count += rejected
+
+                    if len(cleaned):
+                        if dim_loader:
+                            # Committed before the chunk is queued so the
+                            # fact writer always sees its dimension rows
+                            dim_loader.begin_batch()
+                            resolve_dimensions_frame(cleaned, dim_loader)
+                            dim_loader.commit_batch()
+
+                        if writer_errors:
+                            break
+                        batch_queue.put(
+                            fact_records_from_frame(cleaned, dim_caches, org_cache)
+                        )
+
+                    pbar.update(len(df))
+
+            batch_queue.put(None)
+            writer_thread.join()
+            if writer_errors:
+                raise writer_errors[0]
+            fact_count = sum(loaded_counts)
+        else:
+            # Engine-side transform: one INSERT ... SELECT over staging
+            # with the cleaning helpers registered as scalar UDFs. SQLite
+            # drives the per-row loop in C, and dimension keys come from
+            # joins instead of per-row cache lookups.
+            fact_count, rejected_count = load_facts_from_staging(
+                Path(source_file).name, db_path, dim_loader=dim_loader
+            )
 
         print(f"  Facts loaded: {fact_count:,}")
         print(f"  Rejected: {rejected_count:,}")
@@ -260,6 +462,7 @@ def run_etl(
             print("\n  Final dimension counts:")
             for table, count in dim_loader.get_dimension_counts().items():
                 print(f"    {table}: {count:,}")
+            dim_loader.close()
 
         # End logging
         if logger:
@@ -280,6 +483,9 @@ def run_etl(
 
         return False
 
+    finally:
+        conn.close()
+
 
 def main():
     """Main entry point."""
@@ -320,6 +526,18 @@ Examples:
         help="Incremental load (append only)"
     )
 
+    parser.add_argument(
+        "--stage-only",
+        action="store_true",
+        help="Stop after staging (forces staging even on a full refresh)"
+    )
+
+    parser.add_argument(
+        "--fast-count",
+        action="store_true",
+        help="Estimate row count from file size instead of pre-scanning"
+    )
+
     parser.add_argument(
         "--config",
         type=str,
@@ -352,7 +570,10 @@ Examples:
     full_refresh = not args.incremental
 
     # Run ETL
-    success = run_etl(source_file, config, full_refresh)
+    success = run_etl(
+        source_file, config, full_refresh,
+        stage_only=args.stage_only, fast_count=args.fast_count
+    )
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,224 @@
+"""
+Pipelined Processing Module for EMS ETL Pipeline
+Author: J. Ryan Butcher
+
+Overlaps extract, validate, and load via bounded queues so disk reads,
+Python validation, and database I/O run concurrently instead of leaving
+two of the three resources idle at any time.
+"""
+
+import os
+import queue
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+from config import get_config
+from extract import extract_csv_chunks, find_source_files
+from stage import stage_records
+
+# data-quality.py has a hyphen, so load it via importlib (same pattern as main.py)
+import importlib.util
+
+
+def _load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_data_quality = _load_module(
+    "data_quality", Path(__file__).parent / "data-quality.py"
+)
+get_validator = _data_quality.get_validator
+
+# Sentinel signalling end-of-stream between pipeline stages
+_EOF = object()
+
+
+@dataclass
+class PipelineResult:
+    """Result of a pipelined extract/validate/stage run."""
+    total_rows: int = 0
+    staged_rows: int = 0
+    error_rows: int = 0
+
+
+def run_pipeline(
+    source_file: str,
+    db_path: str = None,
+    chunk_size: int = None,
+    queue_size: int = 2
+) -> PipelineResult:
+    """
+    Run extract -> validate -> stage as a three-stage threaded pipeline.
+
+    Each stage runs in its own thread connected by bounded queues
+    (maxsize=queue_size) to keep peak memory predictable. CSV parsing
+    and SQLite I/O release the GIL, so the stages genuinely overlap.
+
+    Args:
+        source_file: Path to source CSV file
+        db_path: Path to SQLite database (uses config default if None)
+        chunk_size: Rows per chunk (uses config default if None)
+        queue_size: Max chunks buffered between stages
+
+    Returns:
+        PipelineResult with row counts
+    """
+    config = get_config()
+    db_path = db_path or config.database.sqlite_path
+    chunk_size = chunk_size or config.etl.batch_size
+
+    source_name = Path(source_file).name
+    validator = get_validator()
+    result = PipelineResult()
+
+    q_validate: queue.Queue = queue.Queue(maxsize=queue_size)
+    q_load: queue.Queue = queue.Queue(maxsize=queue_size)
+
+    def drain(q: queue.Queue):
+        # After a stage fails it must keep consuming its input to _EOF,
+        # otherwise the upstream stage blocks forever in put() on the
+        # bounded queue and the failure never reaches future.result()
+        while q.get() is not _EOF:
+            pass
+
+    def extract_stage():
+        try:
+            for chunk, start_row in extract_csv_chunks(source_file, chunk_size):
+                q_validate.put((chunk, start_row))
+        finally:
+            q_validate.put(_EOF)
+
+    def validate_stage():
+        try:
+            while True:
+                item = q_validate.get()
+                if item is _EOF:
+                    break
+                chunk, start_row = item
+
+                cleaned_chunk = []
+                for i, row in enumerate(chunk):
+                    cleaned, errors = validator.validate_record(row, start_row + i)
+                    cleaned_chunk.append(cleaned)
+                    if errors:
+                        result.error_rows += 1
+                result.total_rows += len(chunk)
+
+                q_load.put((cleaned_chunk, start_row))
+        except Exception:
+            drain(q_validate)
+            raise
+        finally:
+            q_load.put(_EOF)
+
+    def load_stage():
+        try:
+            while True:
+                item = q_load.get()
+                if item is _EOF:
+                    break
+                chunk, start_row = item
+                result.staged_rows += stage_records(
+                    chunk, source_name, db_path, start_row=start_row
+                )
+        except Exception:
+            drain(q_load)
+            raise
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(extract_stage),
+            executor.submit(validate_stage),
+            executor.submit(load_stage),
+        ]
+        # Surface the first stage exception to the caller
+        for future in futures:
+            future.result()
+
+    return result
+
+
+def _init_worker(config_path: Optional[str], env: Optional[str]):
+    """Prime each worker's config singleton once at process startup."""
+    get_config(config_path, env)
+
+
+def process_files(
+    files: List[str] = None,
+    db_path: str = None,
+    chunk_size: int = None,
+    max_workers: int = None,
+    config_path: str = None,
+    env: str = None
+) -> Dict[str, PipelineResult]:
+    """
+    Process multiple source files in parallel worker processes.
+
+    Per-row validation is CPU-bound pure Python, so the GIL caps
+    thread-level speedup; distinct files parallelize cleanly across
+    processes, each worker owning its own validator and config.
+
+    Args:
+        files: Source file paths (auto-detects *.csv in source_path if None)
+        db_path: Path to SQLite database (uses config default if None)
+        chunk_size: Rows per chunk (uses config default if None)
+        max_workers: Worker process count (min(files, cpu_count) if None)
+        config_path: Config path forwarded to each worker
+        env: Environment name forwarded to each worker
+
+    Returns:
+        Dict of source file path -> PipelineResult
+    """
+    if files is None:
+        files = find_source_files("*.csv")
+    if not files:
+        return {}
+
+    max_workers = max_workers or min(len(files), os.cpu_count() or 1)
+
+    # forkserver keeps process spawn cheap without inheriting the
+    # parent's full memory image (Linux)
+    try:
+        mp_context = multiprocessing.get_context("forkserver")
+    except ValueError:
+        mp_context = None
+
+    results: Dict[str, PipelineResult] = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(config_path, env)
+    ) as executor:
+        futures = {
+            executor.submit(run_pipeline, f, db_path, chunk_size): f
+            for f in files
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return results
+
+
+if __name__ == "__main__":
+    # Test pipelined staging
+    import sys
+    from stage import init_staging_table, get_staging_count
+
+    if len(sys.argv) > 1:
+        file_path = sys.argv[1]
+    else:
+        file_path = "./data/input/ems_runs_2024.csv"
+
+    init_staging_table()
+    result = run_pipeline(file_path)
+    print(f"Total rows: {result.total_rows:,}")
+    print(f"Staged: {result.staged_rows:,}")
+    print(f"Rows with errors: {result.error_rows:,}")
+    print(f"Staging count: {get_staging_count():,}")
@@ -6,6 +6,8 @@ Loads raw CSV data into staging tables, preserving original values for traceabil
 """
 
 import sqlite3
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Any
 from pathlib import Path
 from datetime import datetime
@@ -42,13 +44,171 @@ STAGING_COLUMNS = [
     "PATIENT_ARRIVED_DESTINATION_DT"
 ]
 
+# Source-value columns (everything after the three audit columns)
+_SOURCE_COLUMNS = tuple(STAGING_COLUMNS[3:])
 
-def init_staging_table(db_path: str = None):
+_INSERT_PREFIX = (
+    f"INSERT INTO STG_EMS_INCIDENT ({','.join(STAGING_COLUMNS)}) VALUES "
+)
+_VALUES_ROW = f"({','.join('?' for _ in STAGING_COLUMNS)})"
+
+# Rows per multi-row INSERT, bounded by SQLite's default host-parameter
+# limit (SQLITE_MAX_VARIABLE_NUMBER = 32766)
+_ROWS_PER_STMT = 32766 // len(STAGING_COLUMNS)
+
+# Full-width statement built once: constant SQL text means every full
+# group hits the connection's prepared-statement cache
+_FULL_STMT_SQL = _INSERT_PREFIX + ",".join([_VALUES_ROW] * _ROWS_PER_STMT)
+
+
+@lru_cache(maxsize=None)
+def _stmt_sql(group_len: int) -> str:
+    """Statement text for a group of group_len rows, built at most once."""
+    if group_len == _ROWS_PER_STMT:
+        return _FULL_STMT_SQL
+    return _INSERT_PREFIX + ",".join([_VALUES_ROW] * group_len)
+
+
+def _insert_multirow(conn: sqlite3.Connection, rows) -> int:
+    """
+    Insert bound row tuples via packed multi-row VALUES statements.
+
+    One statement binding ~1300 rows replaces ~1300 prepare/step cycles,
+    cutting per-statement overhead that executemany still pays.
+    """
+    rows = iter(rows)
+    total = 0
+    while True:
+        group = list(islice(rows, _ROWS_PER_STMT))
+        if not group:
+            return total
+        conn.execute(
+            _stmt_sql(len(group)),
+            [value for row in group for value in row]
+        )
+        total += len(group)
+
+
+def _staging_rows(records, load_datetime, source_file, start_row):
+    """
+    Generate bound staging tuples lazily as executemany consumes them.
+
+    Avoids materializing a second full copy of the batch; the source
+    values are pulled with one C-level map over dict.get per record.
+    """
+    for i, record in enumerate(records):
+        get = record.get
+        yield (
+            load_datetime,
+            source_file,
+            start_row + i if start_row is not None else get("_source_row_num"),
+        ) + tuple(map(get, _SOURCE_COLUMNS))
+
+
+def stage_csv_range(
+    file_path: str,
+    byte_start: int,
+    byte_end: int,
+    start_row: int,
+    source_file: str,
+    db_path: str = None
+) -> int:
+    """
+    Parse a newline-aligned byte range of a CSV and stage it.
+
+    Designed as a ProcessPoolExecutor task: each worker parses its slice
+    with pyarrow (multithreaded C++) and writes through its own WAL
+    connection, so staging saturates multiple cores while SQLite only
+    serializes the commits. Ranges come from split_csv_byte_ranges.
+
+    Args:
+        file_path: Path to source CSV file
+        byte_start: First byte of the range (on a row boundary)
+        byte_end: Byte past the end of the range
+        start_row: Source row number of the first row in the range
+        source_file: Name of source file for audit
+        db_path: Path to SQLite database
+
+    Returns:
+        Number of records inserted
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    config = get_config()
+    db_path = db_path or config.database.sqlite_path
+
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        f.seek(byte_start)
+        body = f.read(byte_end - byte_start)
+    if not body.strip():
+        return 0
+
+    columns = header.decode('utf-8-sig').rstrip('\r\n').split(',')
+    table = pacsv.read_csv(
+        pa.BufferReader(header + body),
+        convert_options=pacsv.ConvertOptions(
+            column_types={col: "string" for col in columns}
+        )
+    )
+
+    conn = sqlite3.connect(db_path, timeout=60.0, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("BEGIN")
+        inserted = stage_records(
+            table, source_file, db_path, start_row=start_row, conn=conn
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return inserted
+
+
+def _staging_rows_df(df, load_datetime, source_file, start_row):
+    """
+    Generate bound staging tuples from a DataFrame chunk.
+
+    Missing staging columns become None, as do NaN cells, so the bound
+    values match what the dict path produces.
+    """
+    if start_row is not None:
+        row_nums = range(start_row, start_row + len(df))
+    elif "_source_row_num" in df.columns:
+        row_nums = df["_source_row_num"].tolist()
+    else:
+        # extract_csv_chunks_df indexes chunks by source row number
+        row_nums = df.index.tolist()
+
+    projected = df.reindex(columns=list(_SOURCE_COLUMNS)).astype(object)
+    projected = projected.where(projected.notna(), None)
+
+    for row_num, values in zip(
+        row_nums, projected.itertuples(index=False, name=None)
+    ):
+        yield (load_datetime, source_file, row_num) + values
+
+
+def init_staging_table(
+    db_path: str = None,
+    conn: sqlite3.Connection = None,
+    create_index: bool = False
+):
     """
     Create or recreate staging table.
 
+    The load index is deferred by default: building it before the bulk
+    insert makes every row pay B-tree maintenance, where one
+    finalize_staging_indexes call after Step 3 is a single bulk sort.
+
     Args:
         db_path: Path to SQLite database (uses config default if None)
+        conn: Open connection to reuse instead of opening one
+        create_index: Create IX_STG_EMS_LOAD now instead of deferring
+            to finalize_staging_indexes
     """
     config = get_config()
     db_path = db_path or config.database.sqlite_path
@@ -56,7 +216,11 @@ def init_staging_table(db_path: str = None):
     # Ensure directory exists
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        # Must precede the first table creation; no-op on an existing DB
+        conn.execute("PRAGMA page_size=8192")
     try:
         # Drop and recreate for full refresh
         conn.execute("DROP TABLE IF EXISTS STG_EMS_INCIDENT")
@@ -92,46 +256,86 @@ def init_staging_table(db_path: str = None):
             )
         """)
 
-        conn.execute("""
-            CREATE INDEX IX_STG_EMS_LOAD
-            ON STG_EMS_INCIDENT (_load_datetime, _source_file)
-        """)
+        if create_index:
+            conn.execute(_STAGING_INDEX_SQL)
 
         conn.commit()
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
+
+
+_STAGING_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS IX_STG_EMS_LOAD
+    ON STG_EMS_INCIDENT (_load_datetime, _source_file)
+"""
+
+
+def finalize_staging_indexes(db_path: str = None, conn: sqlite3.Connection = None):
+    """
+    Build the staging load index after the bulk insert.
+
+    Args:
+        db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening one
+    """
+    config = get_config()
+    db_path = db_path or config.database.sqlite_path
+
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute(_STAGING_INDEX_SQL)
+        conn.commit()
+    finally:
+        if own_conn:
+            conn.close()
 
 
-def truncate_staging(db_path: str = None):
+def truncate_staging(db_path: str = None, conn: sqlite3.Connection = None):
     """
     Truncate staging table for full refresh.
 
     Args:
         db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening one
     """
     config = get_config()
     db_path = db_path or config.database.sqlite_path
 
-    conn = sqlite3.connect(db_path)
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(db_path, isolation_level=None)
     try:
         conn.execute("DELETE FROM STG_EMS_INCIDENT")
         conn.commit()
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
 def stage_records(
-    records: List[Dict[str, Any]],
+    records,
     source_file: str,
-    db_path: str = None
+    db_path: str = None,
+    start_row: int = None,
+    conn: sqlite3.Connection = None
 ) -> int:
     """
     Insert records into staging table.
 
     Args:
-        records: List of record dictionaries from extraction
+        records: List of record dictionaries, pandas DataFrame, or
+            pyarrow Table/RecordBatch from extraction
         source_file: Name of source file for audit
         db_path: Path to SQLite database
+        start_row: Source row number of the first record; row numbers are
+            derived arithmetically from it (falls back to _source_row_num
+            or the DataFrame index when omitted)
+        conn: Open connection to insert through; the caller owns the
+            transaction (no commit here), letting a whole multi-chunk
+            staging pass share one transaction instead of one per call
 
     Returns:
         Number of records inserted
@@ -139,62 +343,43 @@ def stage_records(
     config = get_config()
     db_path = db_path or config.database.sqlite_path
 
-    if not records:
+    if len(records) == 0:
         return 0
 
     load_datetime = datetime.now().isoformat()
 
-    # Prepare values for bulk insert
-    columns = STAGING_COLUMNS[:]  # Copy list
-    placeholders = ",".join(["?" for _ in columns])
-    insert_sql = f"INSERT INTO STG_EMS_INCIDENT ({','.join(columns)}) VALUES ({placeholders})"
-
-    rows_to_insert = []
-    for record in records:
-        row = [
-            load_datetime,
-            source_file,
-            record.get("_source_row_num"),
-            record.get("INCIDENT_DT"),
-            record.get("INCIDENT_COUNTY"),
-            record.get("CHIEF_COMPLAINT_DISPATCH"),
-            record.get("CHIEF_COMPLAINT_ANATOMIC_LOC"),
-            record.get("PRIMARY_SYMPTOM"),
-            record.get("PROVIDER_IMPRESSION_PRIMARY"),
-            record.get("DISPOSITION_ED"),
-            record.get("DISPOSITION_HOSPITAL"),
-            record.get("INJURY_FLG"),
-            record.get("NALOXONE_GIVEN_FLG"),
-            record.get("MEDICATION_GIVEN_OTHER_FLG"),
-            record.get("DESTINATION_TYPE"),
-            record.get("PROVIDER_TYPE_STRUCTURE"),
-            record.get("PROVIDER_TYPE_SERVICE"),
-            record.get("PROVIDER_TYPE_SERVICE_LEVEL"),
-            record.get("PROVIDER_TO_SCENE_MINS"),
-            record.get("PROVIDER_TO_DESTINATION_MINS"),
-            record.get("UNIT_NOTIFIED_BY_DISPATCH_DT"),
-            record.get("UNIT_ARRIVED_ON_SCENE_DT"),
-            record.get("UNIT_ARRIVED_TO_PATIENT_DT"),
-            record.get("UNIT_LEFT_SCENE_DT"),
-            record.get("PATIENT_ARRIVED_DESTINATION_DT")
-        ]
-        rows_to_insert.append(row)
-
-    conn = sqlite3.connect(db_path)
+    # Columnar chunks stage without ever becoming per-row dicts:
+    # itertuples(name=None) emits plain tuples straight from the column
+    # buffers in C, already projected to staging column order
+    if hasattr(records, "column_names"):    # pyarrow Table / RecordBatch
+        records = records.to_pandas()
+    if hasattr(records, "itertuples"):      # pandas DataFrame
+        rows = _staging_rows_df(records, load_datetime, source_file, start_row)
+    else:
+        rows = _staging_rows(records, load_datetime, source_file, start_row)
+
+    if conn is not None:
+        return _insert_multirow(conn, rows)
+
+    # Autocommit connection + one explicit transaction around the whole
+    # batch; the driver's implicit per-statement BEGIN never fires
+    conn = sqlite3.connect(db_path, isolation_level=None)
     try:
-        conn.executemany(insert_sql, rows_to_insert)
-        conn.commit()
-        return len(rows_to_insert)
+        conn.execute("BEGIN")
+        inserted = _insert_multirow(conn, rows)
+        conn.execute("COMMIT")
+        return inserted
     finally:
         conn.close()
 
 
-def get_staging_count(db_path: str = None) -> int:
+def get_staging_count(db_path: str = None, conn: sqlite3.Connection = None) -> int:
     """
     Get count of records in staging table.
 
     Args:
         db_path: Path to SQLite database
+        conn: Open connection to reuse instead of opening one
 
     Returns:
         Number of staged records
@@ -202,12 +387,15 @@ def get_staging_count(db_path: str = None) -> int:
     config = get_config()
     db_path = db_path or config.database.sqlite_path
 
-    conn = sqlite3.connect(db_path)
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(db_path)
     try:
         cursor = conn.execute("SELECT COUNT(*) FROM STG_EMS_INCIDENT")
         return cursor.fetchone()[0]
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
 def get_staging_sample(db_path: str = None, limit: int = 10) -> List[Dict[str, Any]]:
@@ -227,7 +415,7 @@ def get_staging_sample(db_path: str = None, limit: int = 10) -> List[Dict[str, A
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     try:
-        cursor = conn.execute(f"SELECT * FROM STG_EMS_INCIDENT LIMIT {limit}")
+        cursor = conn.execute("SELECT * FROM STG_EMS_INCIDENT LIMIT ?", (limit,))
         return [dict(row) for row in cursor.fetchall()]
     finally:
         conn.close()
@@ -5,15 +5,27 @@ Author: J. Ryan Butcher
 Applies data quality rules, creates derived columns, and prepares data for loading.
 """
 
+import re
 import sqlite3
 from datetime import datetime
-from typing import Dict, Any, List, Tuple, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+import pandas as pd
+
 from config import get_config
 
+# The cleaning helpers below are pure and EMS extracts repeat the same
+# coded values constantly (counties, complaints, timestamps shared by a
+# dispatch batch), so each is memoized; a cache hit skips strptime/strip
+# work entirely. Whole-record memoization would never hit - every row
+# carries a distinct _source_row_num.
+
 
-@dataclass
+@dataclass(slots=True)
 class TransformResult:
     """Result of transformation for a single record."""
     cleaned_data: Dict[str, Any]
@@ -22,6 +34,42 @@ class TransformResult:
     is_valid: bool
 
 
+# Slash-delimited date shapes (MM/DD/YYYY, YYYY/MM/DD); extracting the
+# components with a compiled regex and handing them to the datetime
+# constructor skips strptime's per-call format interpretation while the
+# constructor still rejects out-of-range months and days
+_MDY_SLASH_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+_YMD_SLASH_RE = re.compile(r"^(\d{4})/(\d{1,2})/(\d{1,2})$")
+
+# Sentinels for the int64 view of datetime64[ns] arrays
+_NAT_INT64 = np.iinfo(np.int64).min
+_NS_PER_MINUTE = 60_000_000_000
+
+
+@lru_cache(maxsize=8192)
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO-style datetime string, memoized across callers.
+
+    The same timestamp reaches several helpers per record (for example
+    unit_notified_dt feeds create_time_key and two time diffs); caching
+    here means each distinct string is parsed once no matter which
+    helper sees it.
+    """
+    if not value:
+        return None
+    s = str(value).strip()
+    # Shape check on the fixed ISO layout; obvious non-dates skip the
+    # exception machinery entirely
+    if len(s) < 10 or s[4] != "-" or s[7] != "-":
+        return None
+    try:
+        return datetime.fromisoformat(s)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=65536)
 def calculate_time_diff_minutes(
     start_dt: Optional[str],
     end_dt: Optional[str]
@@ -40,23 +88,8 @@ def calculate_time_diff_minutes(
         return None
 
     try:
-        # Handle date-only values
-        formats = ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"]
-
-        start = None
-        end = None
-
-        for fmt in formats:
-            try:
-                if start is None:
-                    start = datetime.strptime(str(start_dt).strip(), fmt)
-            except ValueError:
-                pass
-            try:
-                if end is None:
-                    end = datetime.strptime(str(end_dt).strip(), fmt)
-            except ValueError:
-                pass
+        start = _parse_dt(start_dt)
+        end = _parse_dt(end_dt)
 
         if start and end:
             diff = (end - start).total_seconds() / 60
@@ -68,6 +101,7 @@ def calculate_time_diff_minutes(
         return None
 
 
+@lru_cache(maxsize=65536)
 def create_date_key(date_str: Optional[str]) -> int:
     """
     Create date dimension key (YYYYMMDD format).
@@ -82,17 +116,29 @@ def create_date_key(date_str: Optional[str]) -> int:
         return -1
 
     try:
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%Y/%m/%d"]:
-            try:
-                dt = datetime.strptime(str(date_str).strip()[:10], fmt)
-                return int(dt.strftime("%Y%m%d"))
-            except ValueError:
-                continue
-        return -1
+        prefix = str(date_str).strip()[:10]
+        dt = _parse_dt(prefix)
+        if dt is None:
+            match = _MDY_SLASH_RE.match(prefix)
+            if match:
+                year, month, day = int(match[3]), int(match[1]), int(match[2])
+            else:
+                match = _YMD_SLASH_RE.match(prefix)
+                if match:
+                    year, month, day = int(match[1]), int(match[2]), int(match[3])
+            if match:
+                try:
+                    dt = datetime(year, month, day)
+                except ValueError:
+                    return -1
+        if dt is None:
+            return -1
+        return dt.year * 10000 + dt.month * 100 + dt.day
     except Exception:
         return -1
 
 
+@lru_cache(maxsize=65536)
 def create_time_key(datetime_str: Optional[str]) -> int:
     """
     Create time-of-day dimension key (minutes from midnight).
@@ -113,36 +159,50 @@ def create_time_key(datetime_str: Optional[str]) -> int:
         if len(dt_str) == 10:
             return 0
 
-        # Try parsing with time component
-        for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M"]:
-            try:
-                dt = datetime.strptime(dt_str, fmt)
-                return dt.hour * 60 + dt.minute
-            except ValueError:
-                continue
-
-        return -1
+        dt = _parse_dt(dt_str)
+        if dt is None:
+            return -1
+        return dt.hour * 60 + dt.minute
 
     except Exception:
         return -1
 
 
+@lru_cache(maxsize=65536)
 def clean_text(value: Optional[str]) -> Optional[str]:
-    """Clean and normalize text value."""
+    """
+    Clean and normalize text value.
+
+    The cache also acts as an intern table: every repeat of a
+    low-cardinality value (county, disposition, service level) comes
+    back as the same str object, so downstream dict probes in the
+    dimension caches hit the identity fast path.
+    """
     if value is None:
         return None
-    cleaned = str(value).strip()
+    # str.strip() returns the original object when there is nothing to
+    # strip, so already-clean strings (the common case) pass through
+    # without allocating
+    cleaned = (value if isinstance(value, str) else str(value)).strip()
     return cleaned if cleaned else None
 
 
-def parse_flag(value: Any, yes_values: set = None) -> int:
-    """Parse various flag formats to 0/1."""
+_DEFAULT_YES_VALUES = frozenset({"yes", "y", "true", "1", "1.0"})
+_INJURY_YES_VALUES = frozenset({"yes", "y", "true", "1"})
+
+
+@lru_cache(maxsize=65536)
+def parse_flag(value: Any, yes_values: frozenset = _DEFAULT_YES_VALUES) -> int:
+    """
+    Parse various flag formats to 0/1.
+
+    The lru_cache doubles as a raw-value dispatch table: after the
+    first "Yes"/"No"/"1" each repeat is a single dict hit with no
+    strip/lower allocation.
+    """
     if value is None:
         return 0
 
-    if yes_values is None:
-        yes_values = {"yes", "y", "true", "1", "1.0"}
-
     if isinstance(value, (int, float)):
         return 1 if value else 0
 
@@ -150,6 +210,28 @@ def parse_flag(value: Any, yes_values: set = None) -> int:
     return 1 if str_val in yes_values else 0
 
 
+def _parse_minutes(value: Any) -> Optional[float]:
+    """Parse a minutes value; blank, unparseable, or negative -> None."""
+    if not value:
+        return None
+    try:
+        mins = float(value)
+    except (ValueError, TypeError):
+        return None
+    return mins if mins >= 0 else None
+
+
+def _diff_minutes(
+    start: Optional[datetime],
+    end: Optional[datetime]
+) -> Optional[float]:
+    """Minutes between two already-parsed datetimes; None if impossible."""
+    if start is None or end is None:
+        return None
+    diff = (end - start).total_seconds() / 60
+    return round(diff, 2) if diff >= 0 else None
+
+
 def transform_record(record: Dict[str, Any]) -> TransformResult:
     """
     Transform a single staging record.
@@ -160,105 +242,341 @@ def transform_record(record: Dict[str, Any]) -> TransformResult:
     Returns:
         TransformResult with cleaned data, derived columns, and errors
     """
+    return _transform_fields(record.get)
+
+
+def transform_record_row(row: Tuple, col_idx: Dict[str, int]) -> TransformResult:
+    """
+    Transform a plain tuple row using precomputed column positions.
+
+    Skips the per-row dict (or sqlite3.Row) construction of the mapping
+    path; col_idx is built once per cursor from cursor.description.
+
+    Args:
+        row: Tuple of column values
+        col_idx: Column name -> tuple position
+
+    Returns:
+        TransformResult with cleaned data, derived columns, and errors
+    """
+    def get(name, row=row, idx=col_idx.get):
+        i = idx(name)
+        return row[i] if i is not None else None
+
+    return _transform_fields(get)
+
+
+def _transform_fields(get) -> TransformResult:
+    """Shared transform body; get is a field-name accessor."""
     errors = []
     cleaned = {}
     derived = {}
 
+    # === Validate the required field first ===
+
+    # A record with an unparseable incident date is rejected outright,
+    # so skip the rest of the transform for it
+    cleaned["incident_dt"] = clean_text(get("INCIDENT_DT"))
+    date_key = create_date_key(cleaned["incident_dt"])
+    if date_key == -1:
+        cleaned["_source_row_num"] = get("_source_row_num")
+        cleaned["_source_file"] = get("_source_file")
+        derived["date_key"] = -1
+        errors.append((
+            "INCIDENT_DT", "INVALID_DATE",
+            f"Cannot parse date: {get('INCIDENT_DT')}"
+        ))
+        return TransformResult(
+            cleaned_data=cleaned,
+            derived_data=derived,
+            errors=errors,
+            is_valid=False
+        )
+
     # === Clean source columns ===
 
-    # Date fields
-    cleaned["incident_dt"] = clean_text(record.get("INCIDENT_DT"))
-
-    # Text fields - clean and normalize
-    cleaned["incident_county"] = clean_text(record.get("INCIDENT_COUNTY"))
-    cleaned["chief_complaint_dispatch"] = clean_text(record.get("CHIEF_COMPLAINT_DISPATCH"))
-    cleaned["chief_complaint_anatomic_loc"] = clean_text(record.get("CHIEF_COMPLAINT_ANATOMIC_LOC"))
-    cleaned["primary_symptom"] = clean_text(record.get("PRIMARY_SYMPTOM"))
-    cleaned["provider_impression_primary"] = clean_text(record.get("PROVIDER_IMPRESSION_PRIMARY"))
-    cleaned["disposition_ed"] = clean_text(record.get("DISPOSITION_ED"))
-    cleaned["disposition_hospital"] = clean_text(record.get("DISPOSITION_HOSPITAL"))
-    cleaned["destination_type"] = clean_text(record.get("DESTINATION_TYPE"))
-    cleaned["provider_type_structure"] = clean_text(record.get("PROVIDER_TYPE_STRUCTURE"))
-    cleaned["provider_type_service"] = clean_text(record.get("PROVIDER_TYPE_SERVICE"))
-    cleaned["provider_type_service_level"] = clean_text(record.get("PROVIDER_TYPE_SERVICE_LEVEL"))
+    # Text fields - clean and normalize, driven by the same
+    # field-to-column tuples the vectorized path uses
+    for field, column in _TEXT_FIELDS:
+        cleaned[field] = clean_text(get(column))
 
     # Flag fields
-    cleaned["injury_flg"] = parse_flag(record.get("INJURY_FLG"), {"yes", "y", "true", "1"})
-    cleaned["naloxone_given_flg"] = parse_flag(record.get("NALOXONE_GIVEN_FLG"))
-    cleaned["medication_given_flg"] = parse_flag(record.get("MEDICATION_GIVEN_OTHER_FLG"))
+    cleaned["injury_flg"] = parse_flag(get("INJURY_FLG"), _INJURY_YES_VALUES)
+    cleaned["naloxone_given_flg"] = parse_flag(get("NALOXONE_GIVEN_FLG"))
+    cleaned["medication_given_flg"] = parse_flag(get("MEDICATION_GIVEN_OTHER_FLG"))
 
     # Numeric fields
-    try:
-        mins = record.get("PROVIDER_TO_SCENE_MINS")
-        cleaned["provider_to_scene_mins"] = float(mins) if mins and str(mins).strip() else None
-        if cleaned["provider_to_scene_mins"] and cleaned["provider_to_scene_mins"] < 0:
-            cleaned["provider_to_scene_mins"] = None
-    except (ValueError, TypeError):
-        cleaned["provider_to_scene_mins"] = None
-
-    try:
-        mins = record.get("PROVIDER_TO_DESTINATION_MINS")
-        cleaned["provider_to_dest_mins"] = float(mins) if mins and str(mins).strip() else None
-        if cleaned["provider_to_dest_mins"] and cleaned["provider_to_dest_mins"] < 0:
-            cleaned["provider_to_dest_mins"] = None
-    except (ValueError, TypeError):
-        cleaned["provider_to_dest_mins"] = None
+    cleaned["provider_to_scene_mins"] = _parse_minutes(get("PROVIDER_TO_SCENE_MINS"))
+    cleaned["provider_to_dest_mins"] = _parse_minutes(get("PROVIDER_TO_DESTINATION_MINS"))
 
     # Datetime fields
-    cleaned["unit_notified_dt"] = clean_text(record.get("UNIT_NOTIFIED_BY_DISPATCH_DT"))
-    cleaned["unit_arrived_scene_dt"] = clean_text(record.get("UNIT_ARRIVED_ON_SCENE_DT"))
-    cleaned["unit_arrived_patient_dt"] = clean_text(record.get("UNIT_ARRIVED_TO_PATIENT_DT"))
-    cleaned["unit_left_scene_dt"] = clean_text(record.get("UNIT_LEFT_SCENE_DT"))
-    cleaned["patient_arrived_dest_dt"] = clean_text(record.get("PATIENT_ARRIVED_DESTINATION_DT"))
+    for field, column in _DATETIME_FIELDS:
+        cleaned[field] = clean_text(get(column))
 
     # === Create derived columns ===
 
+    # Parse each timestamp once; every key and diff below reuses the
+    # datetime objects instead of re-parsing the strings
+    notified = _parse_dt(cleaned["unit_notified_dt"])
+    arrived_scene = _parse_dt(cleaned["unit_arrived_scene_dt"])
+    arrived_patient = _parse_dt(cleaned["unit_arrived_patient_dt"])
+    left_scene = _parse_dt(cleaned["unit_left_scene_dt"])
+    arrived_dest = _parse_dt(cleaned["patient_arrived_dest_dt"])
+
     # Date and time keys
-    derived["date_key"] = create_date_key(cleaned["incident_dt"])
-    derived["time_of_day_key"] = create_time_key(cleaned["unit_notified_dt"])
+    derived["date_key"] = date_key
+    derived["time_of_day_key"] = (
+        notified.hour * 60 + notified.minute if notified else -1
+    )
 
     # Calculated time measures
-    derived["dispatch_to_arrival_mins"] = calculate_time_diff_minutes(
-        cleaned["unit_notified_dt"],
-        cleaned["unit_arrived_scene_dt"]
+    derived["dispatch_to_arrival_mins"] = _diff_minutes(notified, arrived_scene)
+    derived["arrival_to_patient_mins"] = _diff_minutes(arrived_scene, arrived_patient)
+    derived["scene_time_mins"] = _diff_minutes(arrived_scene, left_scene)
+    derived["total_call_time_mins"] = _diff_minutes(notified, arrived_dest)
+
+    # Always 1 for counting
+    derived["incident_count"] = 1
+
+    # Source tracking
+    cleaned["_source_row_num"] = get("_source_row_num")
+    cleaned["_source_file"] = get("_source_file")
+
+    return TransformResult(
+        cleaned_data=cleaned,
+        derived_data=derived,
+        errors=errors,
+        is_valid=True
     )
 
-    derived["arrival_to_patient_mins"] = calculate_time_diff_minutes(
-        cleaned["unit_arrived_scene_dt"],
-        cleaned["unit_arrived_patient_dt"]
+
+# Cleaned field name -> source column, shared by the scalar and
+# vectorized paths
+_TEXT_FIELDS = (
+    ("incident_county", "INCIDENT_COUNTY"),
+    ("chief_complaint_dispatch", "CHIEF_COMPLAINT_DISPATCH"),
+    ("chief_complaint_anatomic_loc", "CHIEF_COMPLAINT_ANATOMIC_LOC"),
+    ("primary_symptom", "PRIMARY_SYMPTOM"),
+    ("provider_impression_primary", "PROVIDER_IMPRESSION_PRIMARY"),
+    ("disposition_ed", "DISPOSITION_ED"),
+    ("disposition_hospital", "DISPOSITION_HOSPITAL"),
+    ("destination_type", "DESTINATION_TYPE"),
+    ("provider_type_structure", "PROVIDER_TYPE_STRUCTURE"),
+    ("provider_type_service", "PROVIDER_TYPE_SERVICE"),
+    ("provider_type_service_level", "PROVIDER_TYPE_SERVICE_LEVEL"),
+)
+
+_DATETIME_FIELDS = (
+    ("unit_notified_dt", "UNIT_NOTIFIED_BY_DISPATCH_DT"),
+    ("unit_arrived_scene_dt", "UNIT_ARRIVED_ON_SCENE_DT"),
+    ("unit_arrived_patient_dt", "UNIT_ARRIVED_TO_PATIENT_DT"),
+    ("unit_left_scene_dt", "UNIT_LEFT_SCENE_DT"),
+    ("patient_arrived_dest_dt", "PATIENT_ARRIVED_DESTINATION_DT"),
+)
+
+
+def _transform_frame(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Column-wise transform core shared by the batch entry points.
+
+    Stripping, flag parsing, numeric coercion, datetime parsing, and
+    every derived key and duration run as vectorized pandas ops over
+    whole columns. Produces the same cleaned and derived values as
+    transform_record, one column at a time instead of one row at a
+    time.
+
+    Args:
+        df: Raw chunk (string dtype, indexed by source row number)
+
+    Returns:
+        Tuple of (cleaned-and-derived DataFrame covering every input
+        row, boolean valid mask)
+    """
+    out = pd.DataFrame(index=df.index)
+
+    def col(name):
+        if name in df.columns:
+            return df[name]
+        return pd.Series(None, index=df.index, dtype=object)
+
+    def cleaned_text(name):
+        s = col(name).str.strip().astype(object)
+        return s.where(s.notna() & (s != ""), None)
+
+    def flag(name, yes_values):
+        return col(name).str.strip().str.lower().isin(yes_values).astype(int)
+
+    def minutes(name):
+        s = pd.to_numeric(col(name).str.strip(), errors="coerce")
+        return s.where(s >= 0)
+
+    out["incident_dt"] = cleaned_text("INCIDENT_DT")
+    for field, column in _TEXT_FIELDS:
+        out[field] = cleaned_text(column)
+
+    out["injury_flg"] = flag("INJURY_FLG", _INJURY_YES_VALUES)
+    out["naloxone_given_flg"] = flag("NALOXONE_GIVEN_FLG", _DEFAULT_YES_VALUES)
+    out["medication_given_flg"] = flag(
+        "MEDICATION_GIVEN_OTHER_FLG", _DEFAULT_YES_VALUES
     )
 
-    derived["scene_time_mins"] = calculate_time_diff_minutes(
-        cleaned["unit_arrived_scene_dt"],
-        cleaned["unit_left_scene_dt"]
+    out["provider_to_scene_mins"] = minutes("PROVIDER_TO_SCENE_MINS")
+    out["provider_to_dest_mins"] = minutes("PROVIDER_TO_DESTINATION_MINS")
+
+    for field, column in _DATETIME_FIELDS:
+        out[field] = cleaned_text(column)
+
+    # One C-level parse per datetime column; the keys and diffs below
+    # all reuse the datetime64 results instead of re-parsing strings
+    parsed = {
+        field: pd.to_datetime(
+            out[field], format="ISO8601", errors="coerce", cache=True
+        )
+        for field, _ in _DATETIME_FIELDS
+    }
+
+    incident_date = out["incident_dt"].str.slice(0, 10)
+    dates = pd.to_datetime(incident_date, format="%Y-%m-%d", errors="coerce")
+    for fmt in ("%m/%d/%Y", "%Y/%m/%d"):
+        mask = dates.isna() & incident_date.notna()
+        if mask.any():
+            dates[mask] = pd.to_datetime(
+                incident_date[mask], format=fmt, errors="coerce"
+            )
+    out["date_key"] = (
+        dates.dt.year * 10000 + dates.dt.month * 100 + dates.dt.day
+    ).fillna(-1).astype("int64")
+
+    # The remaining derivations are pure numeric kernels over int64
+    # nanosecond arrays (NaT = INT64_MIN); no datetime objects involved
+    epochs = {
+        field: parsed[field].to_numpy(dtype="datetime64[ns]").view("int64")
+        for field, _ in _DATETIME_FIELDS
+    }
+
+    notified = epochs["unit_notified_dt"]
+    # Naive local timestamps, so minute-of-day is minutes since the
+    # epoch modulo one day
+    out["time_of_day_key"] = np.where(
+        notified == _NAT_INT64, -1, (notified // _NS_PER_MINUTE) % 1440
     )
 
-    derived["total_call_time_mins"] = calculate_time_diff_minutes(
-        cleaned["unit_notified_dt"],
-        cleaned["patient_arrived_dest_dt"]
+    def diff(start_field, end_field):
+        start, end = epochs[start_field], epochs[end_field]
+        d = (end - start) / _NS_PER_MINUTE
+        return np.round(
+            np.where((start == _NAT_INT64) | (end == _NAT_INT64) | (d < 0),
+                     np.nan, d),
+            2,
+        )
+
+    out["dispatch_to_arrival_mins"] = diff(
+        "unit_notified_dt", "unit_arrived_scene_dt"
+    )
+    out["arrival_to_patient_mins"] = diff(
+        "unit_arrived_scene_dt", "unit_arrived_patient_dt"
+    )
+    out["scene_time_mins"] = diff("unit_arrived_scene_dt", "unit_left_scene_dt")
+    out["total_call_time_mins"] = diff(
+        "unit_notified_dt", "patient_arrived_dest_dt"
     )
 
-    # Always 1 for counting
-    derived["incident_count"] = 1
+    out["incident_count"] = 1
+    if "_source_row_num" in df.columns:
+        out["_source_row_num"] = df["_source_row_num"]
+    else:
+        out["_source_row_num"] = df.index
 
-    # Source tracking
-    cleaned["_source_row_num"] = record.get("_source_row_num")
-    cleaned["_source_file"] = record.get("_source_file")
+    return out, out["date_key"] != -1
 
-    # === Validation ===
 
-    # Check required field
-    if derived["date_key"] == -1:
-        errors.append(("INCIDENT_DT", "INVALID_DATE", f"Cannot parse date: {record.get('INCIDENT_DT')}"))
+def transform_batch_df(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    """
+    Transform a raw string-typed chunk with column-wise operations.
 
-    is_valid = len([e for e in errors if e[0] == "INCIDENT_DT"]) == 0
+    Args:
+        df: Raw chunk (string dtype, indexed by source row number)
 
-    return TransformResult(
-        cleaned_data=cleaned,
-        derived_data=derived,
-        errors=errors,
-        is_valid=is_valid
-    )
+    Returns:
+        Tuple of (cleaned-and-derived DataFrame restricted to valid
+        rows, rejected row count)
+    """
+    out, valid = _transform_frame(df)
+    return out[valid], int((~valid).sum())
+
+
+# Columns of _transform_frame output that belong in derived_data; the
+# rest are cleaned_data
+_DERIVED_FIELDS = (
+    "date_key",
+    "time_of_day_key",
+    "dispatch_to_arrival_mins",
+    "arrival_to_patient_mins",
+    "scene_time_mins",
+    "total_call_time_mins",
+    "incident_count",
+)
+
+
+def _iter_results(
+    df: pd.DataFrame,
+    out: pd.DataFrame,
+    valid: pd.Series
+) -> Iterator[TransformResult]:
+    """Materialize TransformResults row-wise from a transformed frame."""
+    out = out.astype(object).where(out.notna(), None)
+
+    raw_dates = df["INCIDENT_DT"] if "INCIDENT_DT" in df.columns else None
+    source_files = df["_source_file"] if "_source_file" in df.columns else None
+
+    for pos, row in enumerate(out.to_dict("records")):
+        derived = {field: row.pop(field) for field in _DERIVED_FIELDS}
+        row["_source_file"] = (
+            source_files.iat[pos] if source_files is not None else None
+        )
+
+        errors = []
+        if not valid.iat[pos]:
+            raw = raw_dates.iat[pos] if raw_dates is not None else None
+            errors.append(
+                ("INCIDENT_DT", "INVALID_DATE", f"Cannot parse date: {raw}")
+            )
+
+        yield TransformResult(
+            cleaned_data=row,
+            derived_data=derived,
+            errors=errors,
+            is_valid=len(errors) == 0
+        )
+
+
+def transform_batch_iter(
+    records: Iterable[Dict[str, Any]],
+    chunk_size: int = 10000
+) -> Iterator[TransformResult]:
+    """
+    Stream transform results one record at a time.
+
+    Consumes records lazily in chunk_size slices, runs each slice
+    through the columnar core, and yields per-record results as they
+    are materialized, so peak memory is bounded by the slice rather
+    than the whole batch.
+
+    Args:
+        records: Iterable of staging records
+        chunk_size: Rows pivoted through the columnar core at a time
+
+    Yields:
+        TransformResult per record, in input order
+    """
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        df = pd.DataFrame.from_records(chunk)
+        out, valid = _transform_frame(df)
+        yield from _iter_results(df, out, valid)
 
 
 def transform_batch(
@@ -267,26 +585,18 @@ def transform_batch(
     """
     Transform a batch of records.
 
+    Eager wrapper around transform_batch_iter for callers that want
+    the whole batch plus counts.
+
     Args:
         records: List of staging records
 
     Returns:
         Tuple of (results, valid_count, rejected_count)
     """
-    results = []
-    valid_count = 0
-    rejected_count = 0
-
-    for record in records:
-        result = transform_record(record)
-        results.append(result)
-
-        if result.is_valid:
-            valid_count += 1
-        else:
-            rejected_count += 1
-
-    return results, valid_count, rejected_count
+    results = list(transform_batch_iter(records))
+    valid_count = sum(1 for result in results if result.is_valid)
+    return results, valid_count, len(results) - valid_count
 
 
 if __name__ == "__main__":